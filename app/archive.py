@@ -6,7 +6,7 @@ from typing import Optional, cast
 from uuid import UUID
 
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from app.db.models import QAItem, Tag, QAItemTag, Video
 from app.youtube.ids import build_video_url
@@ -84,7 +84,8 @@ def search_archive(
             v.published_at,
             v.title AS video_title,
             ts_rank(q.search_tsv, plainto_tsquery('english', :query)) AS rank,
-            ARRAY_AGG(DISTINCT t.name) FILTER (WHERE t.name IS NOT NULL) AS tags
+            ARRAY_AGG(DISTINCT t.name) FILTER (WHERE t.name IS NOT NULL) AS tags,
+            COUNT(*) OVER () AS total_count
             {answer_select}
         FROM qa_items q
         JOIN videos v ON v.id = q.video_id
@@ -129,41 +130,17 @@ def search_archive(
         LIMIT :limit OFFSET :offset
     """
 
-    count_sql = """
-        SELECT COUNT(DISTINCT q.id)
-        FROM qa_items q
-        JOIN videos v ON v.id = q.video_id
-        WHERE v.status = 'processed'
-          AND q.search_tsv @@ plainto_tsquery('english', :query)
-    """
-
-    count_params: dict[str, object] = {"query": normalized_query}
-
-    if category:
-        count_sql += " AND q.category = :category"
-        count_params["category"] = category
-
-    if subcategory:
-        count_sql += " AND q.subcategory = :subcategory"
-        count_params["subcategory"] = subcategory
-
-    for index, tag_name in enumerate(tag_list):
-        param_name = f"tag_{index}"
-        count_sql += (
-            f" AND EXISTS ("
-            f"SELECT 1 FROM qa_item_tags qt{index} "
-            f"JOIN tags t{index} ON t{index}.id = qt{index}.tag_id "
-            f"WHERE qt{index}.qa_item_id = q.id AND t{index}.name = :{param_name}"
-            f")"
-        )
-        count_params[param_name] = tag_name
-
-    if passage:
-        count_sql += " AND EXISTS (SELECT 1 FROM unnest(q.passages) p WHERE p ILIKE :passage_pattern)"
-        count_params["passage_pattern"] = f"{passage}%"
-
-    rows = session.execute(text(base_sql), params)
-    total = session.execute(text(count_sql), count_params).scalar() or 0
+    # total_count is a window over the grouped rows, so the full-text match
+    # is evaluated once for both the page and the total.
+    rows = session.execute(text(base_sql), params).all()
+    if rows:
+        total = rows[0].total_count
+    elif offset > 0:
+        # Past the last page: fetch one row of the same query for the total.
+        first = session.execute(text(base_sql), {**params, "limit": 1, "offset": 0}).first()
+        total = first.total_count if first else 0
+    else:
+        total = 0
 
     results = []
     for row in rows:
@@ -212,6 +189,7 @@ def get_archive_answer(session: Session, question_id: str) -> Optional[dict]:
     qa_item = (
         session.query(QAItem)
         .join(Video)
+        .options(contains_eager(QAItem.video))  # Fill qa_item.video from the join
         .filter(QAItem.id == parsed_question_id)
         .filter(Video.status == "processed")
         .first()
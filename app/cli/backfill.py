@@ -10,12 +10,15 @@ Usage:
     python -m app.cli.backfill --file my_videos.txt     # Custom file
     python -m app.cli.backfill --limit 5                # Process only 5 videos
     python -m app.cli.backfill --skip-classification    # Skip LLM classification
+    python -m app.cli.backfill --workers 4              # Process 4 videos at a time
     python -m app.cli.backfill --dry-run                # Don't save to database
 """
 
 import argparse
 import sys
-import time
+from collections.abc import Iterator
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass, field
 
@@ -24,6 +27,10 @@ from app.youtube.ids import get_video_id
 from app.ingest.pipeline import process_video, ProcessResult, reprocess_all_from_stored
 from app.db.engine import get_session
 from app.db import crud
+from app.cli.errorlog import ErrorLog
+from app.cli.ratelimit import RateLimiter
+from app.youtube.cache import configure_cache, get_cache_stats
+from app.youtube.metadata import VideoMetadata, get_videos_metadata
 
 
 @dataclass
@@ -35,50 +42,89 @@ class BackfillStats:
     failed: int = 0
     skipped: int = 0
     total_questions: int = 0
-    errors: list[tuple[str, str]] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    errors: ErrorLog = field(default_factory=ErrorLog)
     
     def print_summary(self):
         """Print a summary of the backfill run."""
         print("\n" + "=" * 60)
         print("BACKFILL SUMMARY")
         print("=" * 60)
-        print(f"Total videos in file:    {self.total}")
+        print(f"Total videos read:       {self.total}")
         print(f"Processed:               {self.processed}")
         print(f"  Successful:            {self.successful}")
         print(f"  Failed:                {self.failed}")
         print(f"Skipped:                 {self.skipped}")
         print(f"Total Q&A items saved:   {self.total_questions}")
+        if self.cache_hits or self.cache_misses:
+            print(f"YouTube cache:           {self.cache_hits} hits, {self.cache_misses} misses")
         
-        if self.errors:
-            print("\nErrors:")
-            for video_id, error in self.errors:
-                print(f"  {video_id}: {error}")
+        self.errors.print()
 
 
-def read_video_urls(filepath: str) -> list[str]:
+def iter_video_urls(filepath: str) -> Iterator[str]:
     """
-    Read video URLs from a text file.
+    Stream video URLs from a text file.
+
+    Lines are read lazily, so callers that only need the first few URLs
+    (e.g. with itertools.islice for --limit) don't read the whole file.
     
     Args:
         filepath: Path to text file with one URL per line
         
-    Returns:
-        List of URLs (empty lines and comments ignored)
+    Yields:
+        URLs in file order (empty lines, comments and repeats ignored)
     """
     path = Path(filepath)
     if not path.exists():
         print(f"Error: File not found: {filepath}")
-        return []
+        return
     
-    urls = []
+    seen = set()
     with open(path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
-            # Skip empty lines and comments
-            if line and not line.startswith('#'):
-                urls.append(line)
+            # Skip empty lines, comments and repeats
+            if line and not line.startswith('#') and line not in seen:
+                seen.add(line)
+                yield line
+
+
+def read_video_urls(filepath: str, limit: int | None = None) -> list[str]:
+    """
+    Read video URLs from a text file.
     
-    return urls
+    Args:
+        filepath: Path to text file with one URL per line
+        limit: Stop after this many URLs
+        
+    Returns:
+        List of URLs (empty lines, comments and repeats ignored)
+    """
+    return list(islice(iter_video_urls(filepath), limit))
+
+
+def _backfill_one(
+    video_id: str,
+    rate_limiter: RateLimiter,
+    skip_classification: bool,
+    verbose: bool,
+    metadata: VideoMetadata | None = None,
+) -> ProcessResult:
+    """
+    Process a single video inside a worker thread.
+
+    process_video opens its own session via get_session(), so no
+    SQLAlchemy Session is ever shared between threads.
+    """
+    rate_limiter.wait()
+    return process_video(
+        video_id,
+        skip_classification=skip_classification,
+        verbose=verbose,
+        metadata=metadata,
+    )
 
 
 def run_backfill(
@@ -88,74 +134,111 @@ def run_backfill(
     dry_run: bool = False,
     delay: float = 1.0,
     skip_processed: bool = False,
+    workers: int = 8,
 ) -> BackfillStats:
     """
     Process a list of video URLs.
+
+    Videos are processed concurrently by a pool of worker threads; a shared
+    rate limiter keeps video starts at least `delay` seconds apart.
     
     Args:
         urls: List of YouTube video URLs
         skip_classification: If True, skip LLM classification
         limit: Maximum number of videos to process
         dry_run: If True, don't save to database
-        delay: Seconds to wait between videos
+        delay: Minimum seconds between starting two videos
         skip_processed: If True, skip videos that are already processed
+        workers: Number of videos to process concurrently
         
     Returns:
         BackfillStats with results
     """
     stats = BackfillStats(total=len(urls))
+    workers = max(1, workers)
     
     if limit:
         urls = urls[:limit]
-        print(f"Processing {len(urls)} of {stats.total} videos (limit={limit})")
+        print(f"Processing {len(urls)} of {stats.total} videos (limit={limit}, workers={workers})")
     else:
-        print(f"Processing {len(urls)} videos")
+        print(f"Processing {len(urls)} videos (workers={workers})")
     
     print()
-    
-    for i, url in enumerate(urls, 1):
+
+    video_ids = []
+    for url in urls:
         try:
-            video_id = get_video_id(url)
-        except ValueError as e:
-            print(f"[{i}/{len(urls)}] SKIP: Invalid URL - {url}")
-            stats.skipped += 1
-            continue
-        
-        print(f"[{i}/{len(urls)}] {video_id}")
-        
-        # Check if already processed (if requested)
-        if skip_processed:
-            with get_session() as session:
-                existing = crud.get_video_by_youtube_id(session, video_id)
-                if existing and getattr(existing, 'status', '') == 'processed':
-                    print("  Already processed - skipping")
-                    stats.skipped += 1
-                    continue
-        
-        if dry_run:
-            print("  (dry run - skipping)")
+            video_ids.append(get_video_id(url))
+        except ValueError:
+            print(f"SKIP: Invalid URL - {url}")
             stats.skipped += 1
-            continue
-        
-        result = process_video(
-            video_id,
-            skip_classification=skip_classification,
-            verbose=True,
-        )
-        
-        stats.processed += 1
-        
-        if result.success:
-            stats.successful += 1
-            stats.total_questions += result.questions_saved
-        else:
-            stats.failed += 1
-            stats.errors.append((video_id, result.error or "Unknown error"))
-        
-        # Rate limiting
-        if i < len(urls) and delay > 0:
-            time.sleep(delay)
+
+    # One query up front instead of a lookup per video
+    if skip_processed and video_ids:
+        with get_session() as session:
+            done = crud.get_processed_youtube_ids(session, video_ids)
+        if done:
+            print(f"Skipping {len(done)} already processed videos")
+            stats.skipped += len(done)
+            video_ids = [video_id for video_id in video_ids if video_id not in done]
+
+    if dry_run:
+        for video_id in video_ids:
+            print(f"{video_id} (dry run - skipping)")
+        stats.skipped += len(video_ids)
+        return stats
+
+    # Metadata for up to 50 videos per request instead of one request each;
+    # process_video fetches anything missing on its own.
+    metadata_by_id = get_videos_metadata(video_ids) if video_ids else {}
+
+    # Per-step output from several threads would interleave, so the
+    # pipeline only runs verbosely when processing one video at a time.
+    verbose = workers == 1
+    rate_limiter = RateLimiter(delay)
+
+    # Futures complete on this thread via as_completed, so stats are only
+    # ever mutated here and need no locking.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _backfill_one,
+                video_id,
+                rate_limiter,
+                skip_classification,
+                verbose,
+                metadata_by_id.get(video_id),
+            ): video_id
+            for video_id in video_ids
+        }
+
+        # On Ctrl-C (or any other escape) drop the queued videos instead of
+        # letting the executor's exit wait for all of them to run.
+        try:
+            for i, future in enumerate(as_completed(futures), 1):
+                video_id = futures[future]
+                prefix = f"[{i}/{len(video_ids)}] {video_id}"
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ProcessResult(youtube_id=video_id, success=False, error=str(e))
+
+                stats.processed += 1
+
+                if result.success:
+                    stats.successful += 1
+                    stats.total_questions += result.questions_saved
+                    print(f"{prefix}: saved {result.questions_saved} Q&A items")
+                else:
+                    stats.failed += 1
+                    stats.errors.add(video_id, result.error or "Unknown error")
+                    print(f"{prefix}: FAILED - {result.error}")
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
     
+    stats.cache_hits, stats.cache_misses = get_cache_stats()
     return stats
 
 
@@ -194,7 +277,13 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Seconds to wait between videos (default: 1.0)"
+        help="Minimum seconds between starting two videos (default: 1.0)"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=8,
+        help="Number of videos to process concurrently (default: 8)"
     )
     parser.add_argument(
         "--from-stored",
@@ -202,6 +291,16 @@ def main():
         help="Re-process videos using stored transcripts (no YouTube API calls). "
              "Use this for re-classification with updated prompts."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use the on-disk YouTube metadata/transcript cache"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached YouTube responses and re-fetch (results are re-cached)"
+    )
     parser.add_argument(
         "--check-config",
         action="store_true",
@@ -279,11 +378,15 @@ def main():
             sys.exit(130)
     else:
         # Read URLs
-        urls = read_video_urls(args.file)
+        # Only read as far into the file as --limit needs
+        urls = read_video_urls(args.file, limit=args.limit)
         if not urls:
             print(f"No URLs found in {args.file}")
             sys.exit(1)
 
+        if not args.no_cache:
+            configure_cache(refresh=args.refresh_cache)
+
         # Run backfill
         try:
             stats = run_backfill(
@@ -293,6 +396,7 @@ def main():
                 dry_run=args.dry_run,
                 delay=args.delay,
                 skip_processed=args.skip_processed,
+                workers=args.workers,
             )
             stats.print_summary()
 
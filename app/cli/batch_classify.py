@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Reclassify stored Q&A items through the Gemini Batch API (half price, up
+to 24h turnaround).
+
+Submitting prints a batch job name; check on it later and apply the
+results once it has finished. Nothing in the database changes until
+`apply`.
+
+Usage:
+    python -m app.cli.batch_classify submit                       # All processed videos
+    python -m app.cli.batch_classify submit --youtube-id VIDEO_ID # One video
+    python -m app.cli.batch_classify submit --limit 500           # First 500 items
+    python -m app.cli.batch_classify status batches/abc123        # Poll a job
+    python -m app.cli.batch_classify apply batches/abc123         # Write results
+"""
+
+import argparse
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.settings import get_settings
+from app.db import crud
+from app.db.engine import get_session
+from app.db.models import QAItem, Video
+from app.qa.classify import Classification
+from app.qa.classify_batch_api import fetch_batch_results, get_batch_state, submit_batch
+
+
+def submit(youtube_id: str | None = None, limit: int | None = None) -> None:
+    """Submit a batch job for processed videos' Q&A items."""
+    with get_session() as session:
+        query = (
+            select(QAItem.id, QAItem.question, QAItem.answer)
+            .join(Video)
+            .where(Video.status == "processed")
+            .order_by(Video.published_at.desc(), QAItem.timestamp_seconds)
+        )
+        if youtube_id:
+            query = query.where(Video.youtube_id == youtube_id)
+        if limit:
+            query = query.limit(limit)
+
+        items = [
+            (str(row.id), row.question, row.answer)
+            for row in session.execute(query)
+        ]
+
+    if not items:
+        print("No Q&A items to classify")
+        return
+
+    print(f"Submitting {len(items)} Q&A item(s)...")
+    name, prefiltered = submit_batch(items)
+
+    if prefiltered:
+        # Too empty to send to Gemini: write the fallback label now, as
+        # live classification would.
+        with get_session() as session:
+            updated = crud.update_qa_classifications(session, {
+                UUID(key): _classification_values(classification)
+                for key, classification in prefiltered.items()
+            })
+        print(f"Labelled {updated} item(s) without Gemini (too little text)")
+
+    if name is None:
+        print("Nothing left to submit")
+        return
+    print(f"Batch job: {name}")
+    print(f"Apply with: python -m app.cli.batch_classify apply {name}")
+
+
+def _classification_values(classification: Classification) -> dict:
+    """Column values for crud.update_qa_classifications."""
+    return {
+        "category": classification.category,
+        "subcategory": classification.subcategory,
+        "tags": list(classification.tags),
+        "passages": list(classification.passages),
+    }
+
+
+def status(name: str) -> None:
+    """Print a batch job's state."""
+    print(f"{name}: {get_batch_state(name)}")
+
+
+def apply(name: str) -> None:
+    """Write a finished batch job's classifications to the database."""
+    results = fetch_batch_results(name)
+    if results is None:
+        print(f"{name} has not finished yet ({get_batch_state(name)})")
+        return
+
+    classifications = {
+        UUID(key): _classification_values(classification)
+        for key, classification in results.items()
+        if classification is not None and key
+    }
+    failed = len(results) - len(classifications)
+
+    with get_session() as session:
+        updated = crud.update_qa_classifications(session, classifications)
+
+    print(f"Results: {len(results)}")
+    print(f"  Updated:               {updated}")
+    print(f"  Failed:                {failed}")
+    if len(classifications) > updated:
+        print(f"  Items no longer found: {len(classifications) - updated}")
+
+
+def main():
+    """Main entry point for the batch classification CLI."""
+    parser = argparse.ArgumentParser(
+        description="Reclassify stored Q&A items with the Gemini Batch API."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = subparsers.add_parser("submit", help="Submit a batch job")
+    submit_parser.add_argument(
+        "--youtube-id",
+        default=None,
+        help="Only this video's Q&A items"
+    )
+    submit_parser.add_argument(
+        "--limit", "-n",
+        type=int,
+        default=None,
+        help="Maximum number of Q&A items"
+    )
+
+    status_parser = subparsers.add_parser("status", help="Show a batch job's state")
+    status_parser.add_argument("name", help="Batch job name (batches/...)")
+
+    apply_parser = subparsers.add_parser("apply", help="Apply a finished batch job")
+    apply_parser.add_argument("name", help="Batch job name (batches/...)")
+
+    args = parser.parse_args()
+
+    settings = get_settings()
+    missing = [
+        key for key in ("DATABASE_URL", "GEMINI_API_KEY")
+        if not getattr(settings, key)
+    ]
+    if missing:
+        print("Configuration errors:")
+        print(f"  Missing: {', '.join(missing)}")
+        sys.exit(1)
+
+    try:
+        if args.command == "submit":
+            submit(youtube_id=args.youtube_id, limit=args.limit)
+        elif args.command == "status":
+            status(args.name)
+        else:
+            apply(args.name)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
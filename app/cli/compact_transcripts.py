@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Move legacy JSONB transcripts into the compressed BYTEA column.
+
+Rows written before migration 002 keep their segments in `raw_data`
+(JSONB). This rewrites them as zlib-compressed JSON in
+`raw_data_compressed` and clears `raw_data`, one batch per transaction.
+Reads go through `Transcript.segments`, which handles both forms, so the
+command can be run (and interrupted) at any time.
+
+Usage:
+    python -m app.cli.compact_transcripts                  # Compact all legacy rows
+    python -m app.cli.compact_transcripts --dry-run        # Only count them
+    python -m app.cli.compact_transcripts --limit 100      # Stop after 100 rows
+    python -m app.cli.compact_transcripts --batch-size 50  # Rows per transaction
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+
+from sqlalchemy import func, select, update
+
+from app.settings import get_settings
+from app.db.codec import compress_json
+from app.db.engine import get_session
+from app.db.models import Transcript
+
+_LEGACY = (Transcript.raw_data.is_not(None), Transcript.raw_data_compressed.is_(None))
+
+
+@dataclass
+class CompactStats:
+    """Statistics for the compaction run."""
+    remaining: int = 0
+    compacted: int = 0
+    bytes_written: int = 0
+
+    def print_summary(self):
+        """Print a summary of the compaction run."""
+        print("\n" + "=" * 60)
+        print("COMPACTION SUMMARY")
+        print("=" * 60)
+        print(f"Legacy transcripts found:  {self.remaining}")
+        print(f"Compacted:                 {self.compacted}")
+        if self.compacted:
+            print(f"Compressed bytes written:  {self.bytes_written:,}")
+
+
+def compact_transcripts(
+    batch_size: int = 100,
+    limit: int | None = None,
+    dry_run: bool = False,
+) -> CompactStats:
+    """
+    Compress legacy JSONB transcripts in batches.
+
+    Args:
+        batch_size: Rows to rewrite per transaction
+        limit: Maximum number of rows to rewrite (None = all)
+        dry_run: If True, only count legacy rows
+
+    Returns:
+        CompactStats with results
+    """
+    stats = CompactStats()
+
+    with get_session() as session:
+        stats.remaining = session.scalar(
+            select(func.count()).select_from(Transcript).where(*_LEGACY)
+        ) or 0
+
+    print(f"Found {stats.remaining} legacy transcript(s)")
+    if dry_run:
+        return stats
+
+    while limit is None or stats.compacted < limit:
+        size = batch_size if limit is None else min(batch_size, limit - stats.compacted)
+
+        with get_session() as session:
+            rows = session.execute(
+                select(Transcript.id, Transcript.raw_data)
+                .where(*_LEGACY)
+                .limit(size)
+            ).all()
+            if not rows:
+                break
+
+            params = []
+            for row in rows:
+                blob = compress_json(row.raw_data)
+                stats.bytes_written += len(blob)
+                params.append({"id": row.id, "raw_data_compressed": blob, "raw_data": None})
+
+            # Bulk UPDATE by primary key (one executemany per batch).
+            session.execute(update(Transcript), params)
+
+        stats.compacted += len(rows)
+        print(f"  Compacted {stats.compacted}/{stats.remaining}")
+
+    return stats
+
+
+def main():
+    """Main entry point for the compaction CLI."""
+    parser = argparse.ArgumentParser(
+        description="Compress legacy JSONB transcripts into raw_data_compressed."
+    )
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=100,
+        help="Rows to rewrite per transaction (default: 100)"
+    )
+    parser.add_argument(
+        "--limit", "-n",
+        type=int,
+        default=None,
+        help="Stop after this many rows"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count legacy rows"
+    )
+
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.DATABASE_URL:
+        print("Configuration errors:")
+        print("  Missing: DATABASE_URL")
+        sys.exit(1)
+
+    try:
+        stats = compact_transcripts(
+            batch_size=max(1, args.batch_size),
+            limit=args.limit,
+            dry_run=args.dry_run,
+        )
+        stats.print_summary()
+
+    except KeyboardInterrupt:
+        # Finished batches are already committed.
+        print("\n\nCompaction interrupted by user.")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Bounded error log shared by the CLI run summaries.
+"""
+
+from collections import deque
+
+# Only the most recent errors are kept for the summary, so a large run with
+# many failures doesn't grow memory or flood the terminal.
+MAX_REPORTED_ERRORS = 500
+
+
+class ErrorLog:
+    """Keeps the most recent (video ID, error) pairs and a total count."""
+
+    def __init__(self, max_reported: int = MAX_REPORTED_ERRORS):
+        """
+        Args:
+            max_reported: How many of the most recent errors to keep
+        """
+        self.entries: deque[tuple[str, str]] = deque(maxlen=max_reported)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def add(self, video_id: str, error: str) -> None:
+        """Record an error; older ones drop out once the log is full."""
+        self.entries.append((video_id, error))
+        self.total += 1
+
+    def print(self) -> None:
+        """Print the kept errors (nothing if there were none)."""
+        if not self.entries:
+            return
+        print("\nErrors:")
+        for video_id, error in self.entries:
+            print(f"  {video_id}: {error}")
+        if self.total > len(self.entries):
+            print(f"  … {self.total - len(self.entries)} more omitted")
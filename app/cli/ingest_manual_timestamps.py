@@ -16,28 +16,41 @@ Usage:
     python -m app.cli.ingest_manual_timestamps --dir my-folder/   # Custom directory
     python -m app.cli.ingest_manual_timestamps --limit 2          # Process only 2 videos
     python -m app.cli.ingest_manual_timestamps --skip-classification  # Skip LLM classification
+    python -m app.cli.ingest_manual_timestamps --workers 4        # Process 4 videos at a time
     python -m app.cli.ingest_manual_timestamps --dry-run          # Don't save to database
 """
 
 import argparse
+import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from sqlalchemy.orm import Session
 
 from app.settings import get_settings
 from app.youtube.ids import get_video_id, build_video_url
-from app.youtube.metadata import get_video_metadata
+from app.youtube.metadata import VideoMetadata, get_video_metadata
 from app.youtube.transcripts import (
+    TranscriptSegment,
     get_raw_transcript,
     transcript_to_raw_data,
     transcript_to_full_text,
 )
 from app.qa.timestamp_parser import parse_description_timestamps
-from app.qa.answer_slicer import slice_answers_by_timestamps
-from app.qa.classify import classify_question, load_categories
+from app.qa.answer_slicer import QAMatch, slice_answers_by_timestamps
+from app.qa.classify import classify_qa_matches, load_categories
 from app.db.engine import get_session
 from app.db import crud
+from app.cli.errorlog import ErrorLog
+from app.cli.ratelimit import RateLimiter
+from app.youtube.cache import configure_cache, get_cache_stats
+
+# Timestamp files are named <video_id>_description.txt (some older files
+# carry the "_decription.txt" typo).
+TIMESTAMP_FILE_SUFFIXES = ("_description.txt", "_decription.txt")
 
 
 @dataclass
@@ -49,7 +62,9 @@ class IngestStats:
     failed: int = 0
     skipped: int = 0
     total_questions: int = 0
-    errors: list[tuple[str, str]] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    errors: ErrorLog = field(default_factory=ErrorLog)
     
     def print_summary(self):
         """Print a summary of the ingest run."""
@@ -62,11 +77,10 @@ class IngestStats:
         print(f"  Failed:                {self.failed}")
         print(f"Skipped:                 {self.skipped}")
         print(f"Total Q&A items saved:   {self.total_questions}")
+        if self.cache_hits or self.cache_misses:
+            print(f"YouTube cache:           {self.cache_hits} hits, {self.cache_misses} misses")
         
-        if self.errors:
-            print("\nErrors:")
-            for video_id, error in self.errors:
-                print(f"  {video_id}: {error}")
+        self.errors.print()
 
 
 def find_timestamp_files(directory: str) -> list[Path]:
@@ -79,14 +93,17 @@ def find_timestamp_files(directory: str) -> list[Path]:
     Returns:
         List of Path objects for files ending in _description.txt or _decription.txt (typo variant)
     """
-    dir_path = Path(directory)
-    if not dir_path.exists():
+    if not os.path.isdir(directory):
         print(f"Error: Directory not found: {directory}")
         return []
     
-    # Handle both correct spelling and typo variant
-    files = list(dir_path.glob("*_description.txt")) + list(dir_path.glob("*_decription.txt"))
-    return sorted(files)
+    # Single directory pass; handles both correct spelling and typo variant
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(TIMESTAMP_FILE_SUFFIXES)
+        )
 
 
 def extract_video_id_from_filename(filename: str) -> str:
@@ -98,8 +115,10 @@ def extract_video_id_from_filename(filename: str) -> str:
         "ucjegR-jiYo_decription.txt" -> "ucjegR-jiYo"
     """
     # Remove _description.txt or _decription.txt suffix
-    name = filename.replace("_description.txt", "").replace("_decription.txt", "")
-    return name
+    for suffix in TIMESTAMP_FILE_SUFFIXES:
+        if filename.endswith(suffix):
+            return filename[:-len(suffix)]
+    return filename
 
 
 def read_manual_timestamps(file_path: Path) -> str:
@@ -116,28 +135,34 @@ def read_manual_timestamps(file_path: Path) -> str:
         return f.read()
 
 
-def process_video_with_manual_timestamps(
+@dataclass
+class PreparedVideo:
+    """Everything fetched/computed for a video, ready to be saved."""
+    video_id: str
+    manual_timestamps: str
+    metadata: VideoMetadata
+    transcript: list[TranscriptSegment]
+    qa_matches: list[QAMatch]
+
+
+def prepare_video_with_manual_timestamps(
     video_id: str,
     manual_timestamps: str,
     skip_classification: bool = False,
     verbose: bool = True,
-    dry_run: bool = False,
-) -> dict:
+) -> tuple[dict, Optional[PreparedVideo]]:
     """
-    Process a video using manually extracted timestamps.
-    
-    This mimics the normal pipeline but uses the manual timestamps instead
-    of fetching the description from YouTube.
-    
+    Fetch, parse, slice and classify a video without touching the database.
+
     Args:
         video_id: YouTube video ID
         manual_timestamps: Text content with timestamps (replaces description)
         skip_classification: If True, skip LLM classification
         verbose: If True, print progress messages
-        dry_run: If True, don't save to database
-        
+
     Returns:
-        Dictionary with success status and counts
+        (result dict, PreparedVideo) on success, or (result dict, None) if a
+        step failed (result["error"] says which)
     """
     settings = get_settings()
     
@@ -160,7 +185,7 @@ def process_video_with_manual_timestamps(
     metadata = get_video_metadata(video_id)
     if not metadata:
         result["error"] = "Failed to fetch video metadata"
-        return result
+        return result, None
     
     result["title"] = metadata.title
     
@@ -179,7 +204,7 @@ def process_video_with_manual_timestamps(
     
     if not questions:
         result["error"] = "No timestamps found in manual file"
-        return result
+        return result, None
     
     # Step 3: Fetch transcript
     if verbose:
@@ -189,7 +214,7 @@ def process_video_with_manual_timestamps(
     
     if not transcript:
         result["error"] = "Failed to fetch transcript"
-        return result
+        return result, None
     
     if verbose:
         print(f"    Transcript: {len(transcript)} segments")
@@ -206,103 +231,138 @@ def process_video_with_manual_timestamps(
     
     if not qa_matches:
         result["error"] = "Failed to slice answers from transcript"
-        return result
+        return result, None
     
     # Step 5: Classify (optional)
     if not skip_classification and settings.GEMINI_API_KEY:
         if verbose:
             print("    Classifying questions...")
         
-        categories = load_categories()
-        
-        for i, qa in enumerate(qa_matches):
-            if verbose:
-                print(f"      [{i+1}/{len(qa_matches)}] {qa.question[:40]}...")
-            
-            classification = classify_question(
-                qa.question,
-                qa.answer,
-                categories,
-            )
-            
-            if classification:
-                qa.category = classification.category
-                qa.subcategory = classification.subcategory
-                qa.tags = classification.tags
-                qa.passages = classification.passages
-            else:
-                qa.category = None
-                qa.subcategory = None
-                qa.tags = []
-                qa.passages = []
+        # All questions are classified concurrently (bounded by a semaphore).
+        classify_qa_matches(qa_matches, load_categories())
     else:
         for qa in qa_matches:
             qa.category = None
             qa.subcategory = None
             qa.tags = []
             qa.passages = []
+
+    return result, PreparedVideo(
+        video_id=video_id,
+        manual_timestamps=manual_timestamps,
+        metadata=metadata,
+        transcript=transcript,
+        qa_matches=qa_matches,
+    )
+
+
+def save_prepared_video(session: Session, prepared: PreparedVideo) -> int:
+    """
+    Write a prepared video, its transcript and Q&A items using `session`.
+
+    Does not commit; the caller owns the transaction.
+
+    Returns:
+        Number of Q&A items saved
+    """
+    metadata = prepared.metadata
+    video_id = prepared.video_id
+
+    # Upsert video record with UPDATED description that includes timestamps
+    updated_description = metadata.description + "\n\n" + prepared.manual_timestamps
+    
+    video = crud.upsert_video(
+        session=session,
+        youtube_id=video_id,
+        url=build_video_url(video_id),
+        title=metadata.title,
+        channel_id=metadata.channel_id,
+        channel_title=metadata.channel_title,
+        published_at=metadata.published_at,
+        description=updated_description,  # Include manual timestamps
+        status="processed",
+    )
+    
+    # Save transcript
+    crud.upsert_transcript(
+        session=session,
+        video_id=video.id,
+        raw_data=transcript_to_raw_data(prepared.transcript),
+        full_text=transcript_to_full_text(prepared.transcript),
+    )
+    
+    # Save Q&A items
+    crud.bulk_upsert_qa_items(
+        session,
+        video.id,
+        [asdict(qa) for qa in prepared.qa_matches],
+    )
+    
+    # Mark as processed
+    crud.mark_video_processed(session, video)
+
+    return len(prepared.qa_matches)
+
+
+def process_video_with_manual_timestamps(
+    video_id: str,
+    manual_timestamps: str,
+    skip_classification: bool = False,
+    verbose: bool = True,
+    dry_run: bool = False,
+    session: Optional[Session] = None,
+) -> dict:
+    """
+    Process a video using manually extracted timestamps.
+    
+    This mimics the normal pipeline but uses the manual timestamps instead
+    of fetching the description from YouTube.
+    
+    Args:
+        video_id: YouTube video ID
+        manual_timestamps: Text content with timestamps (replaces description)
+        skip_classification: If True, skip LLM classification
+        verbose: If True, print progress messages
+        dry_run: If True, don't save to database
+        session: Optional session to write through. The video is saved inside
+            a SAVEPOINT and the caller commits; otherwise a new session is
+            opened and committed for this video alone.
+        
+    Returns:
+        Dictionary with success status and counts
+    """
+    result, prepared = prepare_video_with_manual_timestamps(
+        video_id,
+        manual_timestamps,
+        skip_classification=skip_classification,
+        verbose=verbose,
+    )
+    if prepared is None:
+        return result
     
     # Step 6: Save to database (unless dry run)
     if dry_run:
         if verbose:
-            print(f"    DRY RUN - Would save {len(qa_matches)} Q&A items")
+            print(f"    DRY RUN - Would save {len(prepared.qa_matches)} Q&A items")
         result["success"] = True
-        result["questions_saved"] = len(qa_matches)
+        result["questions_saved"] = len(prepared.qa_matches)
         return result
     
     if verbose:
         print("    Saving to database...")
     
     try:
-        with get_session() as session:
-            # Upsert video record with UPDATED description that includes timestamps
-            updated_description = metadata.description + "\n\n" + manual_timestamps
-            
-            video = crud.upsert_video(
-                session=session,
-                youtube_id=video_id,
-                url=build_video_url(video_id),
-                title=metadata.title,
-                channel_id=metadata.channel_id,
-                channel_title=metadata.channel_title,
-                published_at=metadata.published_at,
-                description=updated_description,  # Include manual timestamps
-                status="processed",
-            )
-            
-            # Save transcript
-            crud.upsert_transcript(
-                session=session,
-                video_id=video.id,
-                raw_data=transcript_to_raw_data(transcript),
-                full_text=transcript_to_full_text(transcript),
-            )
-            
-            # Save Q&A items
-            for qa in qa_matches:
-                crud.upsert_qa_item(
-                    session=session,
-                    video_id=video.id,
-                    timestamp_text=qa.timestamp_text,
-                    timestamp_seconds=qa.timestamp_seconds,
-                    question=qa.question,
-                    answer=qa.answer,
-                    answer_preview=qa.answer_preview,
-                    category=qa.category,
-                    subcategory=qa.subcategory,
-                    tags=qa.tags,
-                    passages=qa.passages,
-                )
-            
-            # Mark as processed
-            crud.mark_video_processed(session, video)
-            
-            result["questions_saved"] = len(qa_matches)
+        if session is None:
+            with get_session() as own_session:
+                result["questions_saved"] = save_prepared_video(own_session, prepared)
+        else:
+            with session.begin_nested():
+                result["questions_saved"] = save_prepared_video(session, prepared)
         
         result["success"] = True
         
         if verbose:
-            print(f"    ✓ Saved {len(qa_matches)} Q&A items")
+            print(f"    ✓ Saved {result['questions_saved']} Q&A items")
         
     except Exception as e:
         result["error"] = f"Database error: {str(e)}"
@@ -312,27 +372,92 @@ def process_video_with_manual_timestamps(
     return result
 
 
+def _prepare_one(
+    video_id: str,
+    file_path: Path,
+    rate_limiter: RateLimiter,
+    skip_classification: bool,
+    verbose: bool,
+) -> tuple[dict, Optional[PreparedVideo]]:
+    """
+    Read one timestamp file and prepare its video inside a worker thread.
+
+    Workers never touch the database; saving happens on the main thread.
+    """
+    try:
+        manual_timestamps = read_manual_timestamps(file_path)
+    except Exception as e:
+        return {"success": False, "error": f"File read error: {e}", "read_error": True}, None
+
+    rate_limiter.wait()
+    return prepare_video_with_manual_timestamps(
+        video_id=video_id,
+        manual_timestamps=manual_timestamps,
+        skip_classification=skip_classification,
+        verbose=verbose,
+    )
+
+
+def _save_batch(batch: list[tuple[dict, PreparedVideo]]) -> None:
+    """
+    Save prepared videos in one transaction, one SAVEPOINT per video.
+
+    A failing video only rolls back its own savepoint; the rest of the
+    batch still commits together. Fills in each result dict in place.
+    """
+    try:
+        with get_session() as session:
+            for result, prepared in batch:
+                try:
+                    with session.begin_nested():
+                        result["questions_saved"] = save_prepared_video(session, prepared)
+                    result["success"] = True
+                except Exception as e:
+                    result["error"] = f"Database error: {str(e)}"
+    except Exception as e:
+        # The commit itself failed, so nothing in the batch was saved.
+        for result, _ in batch:
+            result["success"] = False
+            result["questions_saved"] = 0
+            result["error"] = f"Database error: {str(e)}"
+
+
 def run_manual_ingest(
     directory: str,
     skip_classification: bool = False,
     limit: int | None = None,
     dry_run: bool = False,
     delay: float = 1.0,
+    workers: int = 8,
+    batch_size: int = 20,
+    skip_processed: bool = False,
 ) -> IngestStats:
     """
     Process all timestamp files in a directory.
+
+    Videos are fetched and classified concurrently by a pool of worker
+    threads (a shared rate limiter keeps video starts at least `delay`
+    seconds apart). Results are written from the main thread, committing
+    once per `batch_size` videos.
     
     Args:
         directory: Directory containing timestamp files
         skip_classification: If True, skip LLM classification
         limit: Maximum number of videos to process
         dry_run: If True, don't save to database
-        delay: Seconds to wait between videos
+        delay: Minimum seconds between starting two videos
+        workers: Number of videos to process concurrently
+        batch_size: Number of videos saved per database transaction
+        skip_processed: If True, skip videos that already have status
+            'processed' (off by default: manual timestamps usually target
+            processed videos that ended up with no Q&A items)
         
     Returns:
         IngestStats with results
     """
     stats = IngestStats()
+    workers = max(1, workers)
+    batch_size = max(1, batch_size)
     
     # Find all timestamp files
     files = find_timestamp_files(directory)
@@ -344,53 +469,101 @@ def run_manual_ingest(
     
     if limit:
         files = files[:limit]
-        print(f"Processing {len(files)} of {stats.total} videos (limit={limit})")
+        print(f"Processing {len(files)} of {stats.total} videos (limit={limit}, workers={workers})")
     else:
-        print(f"Processing {len(files)} videos from {directory}")
+        print(f"Processing {len(files)} videos from {directory} (workers={workers})")
     
     print()
-    
-    for i, file_path in enumerate(files, 1):
-        try:
-            video_id = extract_video_id_from_filename(file_path.name)
-        except Exception as e:
-            print(f"[{i}/{len(files)}] SKIP: Invalid filename - {file_path.name}")
-            stats.skipped += 1
-            continue
-        
-        print(f"[{i}/{len(files)}] {video_id}")
-        
-        # Read manual timestamps
-        try:
-            manual_timestamps = read_manual_timestamps(file_path)
-        except Exception as e:
-            print(f"  ✗ Error reading file: {e}")
-            stats.failed += 1
-            stats.errors.append((video_id, f"File read error: {e}"))
-            continue
-        
-        # Process the video
-        result = process_video_with_manual_timestamps(
-            video_id=video_id,
-            manual_timestamps=manual_timestamps,
-            skip_classification=skip_classification,
-            verbose=True,
-            dry_run=dry_run,
-        )
-        
-        stats.processed += 1
-        
+
+    file_ids = [(file_path, extract_video_id_from_filename(file_path.name)) for file_path in files]
+
+    # One query up front instead of a lookup per video
+    if skip_processed:
+        with get_session() as session:
+            processed = crud.get_processed_youtube_ids(
+                session, [video_id for _, video_id in file_ids]
+            )
+        if processed:
+            print(f"Skipping {len(processed)} already processed videos")
+            stats.skipped += len(processed)
+            file_ids = [(f, video_id) for f, video_id in file_ids if video_id not in processed]
+
+    # Per-step output from several threads would interleave, so the
+    # pipeline only runs verbosely when processing one video at a time.
+    verbose = workers == 1
+    rate_limiter = RateLimiter(delay)
+    done = 0
+
+    def record(video_id: str, result: dict) -> None:
+        nonlocal done
+        done += 1
+        prefix = f"[{done}/{len(file_ids)}] {video_id}"
+
+        if not result.get("read_error"):
+            stats.processed += 1
+
         if result["success"]:
             stats.successful += 1
             stats.total_questions += result["questions_saved"]
+            action = "would save" if dry_run else "saved"
+            print(f"{prefix}: {action} {result['questions_saved']} Q&A items")
         else:
             stats.failed += 1
-            stats.errors.append((video_id, result["error"] or "Unknown error"))
-        
-        # Rate limiting
-        if i < len(files) and delay > 0:
-            time.sleep(delay)
+            stats.errors.add(video_id, result["error"] or "Unknown error")
+            print(f"{prefix}: ✗ {result['error']}")
+
+    def flush(batch: list[tuple[dict, PreparedVideo]]) -> None:
+        _save_batch(batch)
+        for result, prepared in batch:
+            record(prepared.video_id, result)
+        batch.clear()
+
+    # Futures complete on this thread via as_completed, so stats and the
+    # pending batch are only ever touched here and need no locking.
+    batch: list[tuple[dict, PreparedVideo]] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for file_path, video_id in file_ids:
+            future = executor.submit(
+                _prepare_one,
+                video_id,
+                file_path,
+                rate_limiter,
+                skip_classification,
+                verbose,
+            )
+            futures[future] = video_id
+
+        # On Ctrl-C, or if a batch save raises, drop the queued files
+        # instead of letting the executor's exit prepare (and classify)
+        # every one of them only to throw the results away.
+        try:
+            for future in as_completed(futures):
+                video_id = futures[future]
+
+                try:
+                    result, prepared = future.result()
+                except Exception as e:
+                    result, prepared = {"success": False, "error": str(e)}, None
+
+                if prepared is None:
+                    record(video_id, result)
+                elif dry_run:
+                    result["success"] = True
+                    result["questions_saved"] = len(prepared.qa_matches)
+                    record(video_id, result)
+                else:
+                    batch.append((result, prepared))
+                    if len(batch) >= batch_size:
+                        flush(batch)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if batch:
+        flush(batch)
     
+    stats.cache_hits, stats.cache_misses = get_cache_stats()
     return stats
 
 
@@ -424,7 +597,34 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Seconds to wait between videos (default: 1.0)"
+        help="Minimum seconds between starting two videos (default: 1.0)"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=8,
+        help="Number of videos to process concurrently (default: 8)"
+    )
+    parser.add_argument(
+        "--skip-processed",
+        action="store_true",
+        help="Skip videos that are already successfully processed"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=20,
+        help="Videos saved per database transaction (default: 20)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use the on-disk YouTube metadata/transcript cache"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached YouTube responses and re-fetch (results are re-cached)"
     )
     parser.add_argument(
         "--check-config",
@@ -451,6 +651,9 @@ def main():
         print(f"  GEMINI_API_KEY: {'set' if settings.GEMINI_API_KEY else 'not set'}")
         sys.exit(0)
     
+    if not args.no_cache:
+        configure_cache(refresh=args.refresh_cache)
+
     # Run manual ingest
     try:
         stats = run_manual_ingest(
@@ -459,6 +662,9 @@ def main():
             limit=args.limit,
             dry_run=args.dry_run,
             delay=args.delay,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            skip_processed=args.skip_processed,
         )
         stats.print_summary()
         
@@ -0,0 +1,42 @@
+"""
+Thread-safe rate limiting for the CLI ingest scripts.
+
+Replaces the fixed ``time.sleep(delay)`` between videos so that several
+worker threads can share a single request budget.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Leaky-bucket limiter: callers are released at most once per interval.
+
+    Shared between worker threads; each call to ``wait()`` blocks until at
+    least ``min_interval`` seconds have passed since the previous release.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Args:
+            min_interval: Minimum seconds between two releases (0 disables)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller is allowed to start its next unit of work."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed)
+            self._next_allowed = scheduled + self.min_interval
+
+        # Sleep outside the lock so other threads can reserve their slots.
+        sleep_for = scheduled - now
+        if sleep_for > 0:
+            time.sleep(sleep_for)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Queue worker that drains pending ingest jobs.
+
+Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+worker threads (and worker processes on other machines) can run at once
+without picking the same video.
+
+Usage:
+    python -m app.cli.worker                          # Drain the queue with 4 threads
+    python -m app.cli.worker --workers 8              # More threads
+    python -m app.cli.worker --max-jobs 20            # Stop after 20 jobs
+    python -m app.cli.worker --follow                 # Keep waiting for new jobs
+    python -m app.cli.worker --skip-classification    # Skip LLM classification
+
+With --follow, idle threads sleep until Postgres sends a NOTIFY on the
+ingest_jobs channel (emitted whenever a job is enqueued), so new videos
+start within moments instead of at the next poll. The poll interval
+remains as a fallback for retried jobs and missed notifications. LISTEN
+needs a direct connection: through a transaction-mode pooler (Neon's
+-pooler host) notifications aren't delivered and the worker only polls.
+"""
+
+import argparse
+import select
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from app.settings import get_settings
+from app.cli.errorlog import ErrorLog
+from app.db.crud import INGEST_JOBS_CHANNEL
+from app.db.engine import get_engine
+from app.ingest.jobs import get_and_lock_pending_job
+from app.ingest.pipeline import process_video_from_job
+
+
+@dataclass
+class WorkerStats:
+    """Statistics for the worker run."""
+    processed: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_questions: int = 0
+    errors: ErrorLog = field(default_factory=ErrorLog)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def print_summary(self):
+        """Print a summary of the worker run."""
+        print("\n" + "=" * 60)
+        print("WORKER SUMMARY")
+        print("=" * 60)
+        print(f"Jobs processed:          {self.processed}")
+        print(f"  Successful:            {self.successful}")
+        print(f"  Failed:                {self.failed}")
+        print(f"Total Q&A items saved:   {self.total_questions}")
+
+        self.errors.print()
+
+
+def _listen_for_jobs(wake: threading.Condition, stop: threading.Event, poll_interval: float) -> None:
+    """
+    LISTEN for enqueue notifications and wake idle worker threads.
+
+    Runs on its own autocommit connection. If listening fails the threads
+    keep polling every poll_interval, so errors are reported, not raised.
+    """
+    try:
+        with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql(f"LISTEN {INGEST_JOBS_CHANNEL}")
+            dbapi_conn = conn.connection.driver_connection
+            try:
+                while not stop.is_set():
+                    # Bounded wait so a stop request is noticed promptly.
+                    ready, _, _ = select.select([dbapi_conn], [], [], min(poll_interval, 5.0))
+                    if not ready:
+                        continue
+                    dbapi_conn.poll()
+                    if dbapi_conn.notifies:
+                        dbapi_conn.notifies.clear()
+                        with wake:
+                            wake.notify_all()
+            finally:
+                conn.exec_driver_sql("UNLISTEN *")
+    except Exception as e:
+        if not stop.is_set():
+            print(f"Job notifications unavailable, polling every {poll_interval:g}s: {e}")
+
+
+def _worker_loop(
+    stats: WorkerStats,
+    claimed: list[int],
+    max_jobs: int | None,
+    skip_classification: bool,
+    follow: bool,
+    poll_interval: float,
+    stop: threading.Event,
+    wake: threading.Condition,
+) -> None:
+    """
+    Claim and process jobs until the queue is empty (or forever with follow).
+
+    Shared counters are only touched under stats.lock.
+    """
+    while not stop.is_set():
+        with stats.lock:
+            if max_jobs is not None and claimed[0] >= max_jobs:
+                return
+            claimed[0] += 1
+
+        youtube_id = get_and_lock_pending_job()
+        if youtube_id is None:
+            with stats.lock:
+                claimed[0] -= 1
+            if not follow:
+                return
+            # Woken early by the listener (or by stop); otherwise re-poll.
+            with wake:
+                if not stop.is_set():
+                    wake.wait(poll_interval)
+            continue
+
+        try:
+            result = process_video_from_job(
+                youtube_id,
+                skip_classification=skip_classification,
+                verbose=False,
+            )
+            success, error, saved = result.success, result.error, result.questions_saved
+        except Exception as e:
+            success, error, saved = False, str(e), 0
+
+        with stats.lock:
+            stats.processed += 1
+            if success:
+                stats.successful += 1
+                stats.total_questions += saved
+                print(f"{youtube_id}: saved {saved} Q&A items")
+            else:
+                stats.failed += 1
+                stats.errors.add(youtube_id, error or "Unknown error")
+                print(f"{youtube_id}: FAILED - {error}")
+
+
+def run_worker(
+    workers: int = 4,
+    max_jobs: int | None = None,
+    skip_classification: bool = False,
+    follow: bool = False,
+    poll_interval: float = 30.0,
+) -> WorkerStats:
+    """
+    Process pending ingest jobs with a pool of threads.
+
+    Args:
+        workers: Number of jobs to process concurrently
+        max_jobs: Stop after claiming this many jobs (None = no limit)
+        skip_classification: If True, skip LLM classification
+        follow: If True, keep waiting for new jobs instead of exiting
+        poll_interval: Seconds to wait between polls when the queue is empty
+            and no notification arrives
+
+    Returns:
+        WorkerStats with results
+    """
+    stats = WorkerStats()
+    claimed = [0]
+    stop = threading.Event()
+    wake = threading.Condition()
+    workers = max(1, workers)
+
+    print(f"Starting {workers} worker thread(s)")
+
+    listener = None
+    if follow:
+        listener = threading.Thread(
+            target=_listen_for_jobs, args=(wake, stop, poll_interval), daemon=True
+        )
+        listener.start()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _worker_loop,
+                stats,
+                claimed,
+                max_jobs,
+                skip_classification,
+                follow,
+                poll_interval,
+                stop,
+                wake,
+            )
+            for _ in range(workers)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except KeyboardInterrupt:
+            # Let in-flight jobs finish; no new jobs are claimed.
+            stop.set()
+            with wake:
+                wake.notify_all()
+            raise
+
+    if listener is not None:
+        stop.set()
+        listener.join(timeout=10)
+
+    return stats
+
+
+def main():
+    """Main entry point for the queue worker CLI."""
+    parser = argparse.ArgumentParser(
+        description="Process pending ingest jobs from the database queue."
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=4,
+        help="Number of jobs to process concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--max-jobs", "-n",
+        type=int,
+        default=None,
+        help="Stop after this many jobs"
+    )
+    parser.add_argument(
+        "--skip-classification",
+        action="store_true",
+        help="Skip LLM classification step"
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep waiting for new jobs (woken by NOTIFY) instead of exiting when the queue is empty"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30.0,
+        help="Fallback seconds between polls when the queue is empty (default: 30)"
+    )
+
+    args = parser.parse_args()
+
+    settings = get_settings()
+    missing = settings.validate()
+    if missing:
+        print("Configuration errors:")
+        for key in missing:
+            print(f"  Missing: {key}")
+        sys.exit(1)
+
+    try:
+        stats = run_worker(
+            workers=args.workers,
+            max_jobs=args.max_jobs,
+            skip_classification=args.skip_classification,
+            follow=args.follow,
+            poll_interval=args.poll_interval,
+        )
+        stats.print_summary()
+        sys.exit(1 if stats.failed > 0 else 0)
+
+    except KeyboardInterrupt:
+        print("\n\nWorker interrupted by user.")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
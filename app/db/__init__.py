@@ -1,10 +1,11 @@
 # Database module
-from app.db.engine import get_engine, get_session, SessionLocal
+from app.db.engine import get_engine, get_session, get_session_factory, SessionLocal
 from app.db.models import Video, QAItem, Tag, QAItemTag, Transcript, IngestJob
 
 __all__ = [
     "get_engine",
     "get_session", 
+    "get_session_factory",
     "SessionLocal",
     "Video",
     "QAItem",
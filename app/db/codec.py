@@ -0,0 +1,22 @@
+"""
+Compact binary encoding for large JSON payloads stored in BYTEA columns.
+"""
+
+import zlib
+from typing import Any
+
+import orjson
+
+# zlib level 6 (the library default) gets most of the ratio on transcript
+# text at a fraction of the CPU cost of level 9.
+COMPRESSION_LEVEL = 6
+
+
+def compress_json(value: Any) -> bytes:
+    """Serialize a JSON-compatible value and compress it."""
+    return zlib.compress(orjson.dumps(value), COMPRESSION_LEVEL)
+
+
+def decompress_json(data: bytes) -> Any:
+    """Inverse of compress_json."""
+    return orjson.loads(zlib.decompress(data))
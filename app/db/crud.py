@@ -4,17 +4,37 @@ Database CRUD operations for videos, Q&A items, tags, and transcripts.
 
 from datetime import datetime, timezone
 from typing import Optional
+from uuid import UUID, uuid4
+from sqlalchemy import ARRAY, bindparam, delete, exists, func, literal, select, text, update
 from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
 
+from app.db.codec import compress_json
 from app.db.models import Video, QAItem, Tag, QAItemTag, Transcript, IngestJob
 
 
 # --- Video Operations ---
 
 def get_video_by_youtube_id(session: Session, youtube_id: str) -> Optional[Video]:
-    """Get a video by its YouTube ID."""
-    return session.query(Video).filter(Video.youtube_id == youtube_id).first()
+    """Get a video by its YouTube ID (unique, so at most one row)."""
+    return session.scalar(select(Video).where(Video.youtube_id == youtube_id))
+
+
+def video_exists(session: Session, youtube_id: str) -> bool:
+    """Check whether a video is stored, without loading it."""
+    return bool(session.scalar(select(exists().where(Video.youtube_id == youtube_id))))
+
+
+def get_processed_youtube_ids(session: Session, youtube_ids: list[str]) -> set[str]:
+    """Return the subset of `youtube_ids` whose video is already processed."""
+    if not youtube_ids:
+        return set()
+    return set(session.scalars(
+        select(Video.youtube_id).where(
+            Video.youtube_id.in_(youtube_ids),
+            Video.status == "processed",
+        )
+    ))
 
 
 def upsert_video(
@@ -30,48 +50,44 @@ def upsert_video(
 ) -> Video:
     """
     Insert or update a video record.
+
+    Runs as a single INSERT ... ON CONFLICT (youtube_id) DO UPDATE ...
+    RETURNING. Optional fields passed as None keep their stored value.
     Returns the Video object.
     """
-    video = get_video_by_youtube_id(session, youtube_id)
-    
-    if video:
-        # Update existing
-        setattr(video, "url", url)
-        if title is not None:
-            setattr(video, "title", title)
-        if channel_id is not None:
-            setattr(video, "channel_id", channel_id)
-        if channel_title is not None:
-            setattr(video, "channel_title", channel_title)
-        if published_at is not None:
-            setattr(video, "published_at", published_at)
-        if description is not None:
-            setattr(video, "description", description)
-        setattr(video, "status", status)
-    else:
-        # Insert new
-        video = Video(
-            youtube_id=youtube_id,
-            url=url,
-            title=title,
-            channel_id=channel_id,
-            channel_title=channel_title,
-            published_at=published_at,
-            description=description,
-            status=status,
-        )
-        session.add(video)
-    
-    session.flush()  # Get the ID
-    return video
+    values = {
+        "youtube_id": youtube_id,
+        "url": url,
+        "title": title,
+        "channel_id": channel_id,
+        "channel_title": channel_title,
+        "published_at": published_at,
+        "description": description,
+        "status": status,
+    }
+    update_columns = ["url", "status"] + [
+        key
+        for key in ("title", "channel_id", "channel_title", "published_at", "description")
+        if values[key] is not None
+    ]
+
+    stmt = insert(Video).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Video.youtube_id],
+        set_={key: stmt.excluded[key] for key in update_columns},
+    ).returning(Video)
+
+    # populate_existing refreshes a Video already loaded in this session.
+    return session.execute(
+        stmt, execution_options={"populate_existing": True}
+    ).scalar_one()
 
 
 def mark_video_processed(session: Session, video: Video, error: Optional[str] = None):
     """Mark a video as processed (or failed with error)."""
-    setattr(video, "processed_at", datetime.now(timezone.utc))
-    setattr(video, "status", "failed" if error else "processed")
-    setattr(video, "error", error)
-    session.flush()
+    video.processed_at = datetime.now(timezone.utc)
+    video.status = "failed" if error else "processed"
+    video.error = error
 
 
 # --- Transcript Operations ---
@@ -82,111 +98,93 @@ def upsert_transcript(
     raw_data: list[dict],
     full_text: Optional[str] = None,
 ) -> Transcript:
-    """Insert or update transcript for a video."""
-    transcript = session.query(Transcript).filter(Transcript.video_id == video_id).first()
-    
-    if transcript:
-        setattr(transcript, "raw_data", raw_data)
-        setattr(transcript, "full_text", full_text)
-    else:
-        transcript = Transcript(
-            video_id=video_id,
-            raw_data=raw_data,
-            full_text=full_text,
-        )
-        session.add(transcript)
-    
-    session.flush()
-    return transcript
+    """
+    Insert or update transcript for a video.
 
+    Segments are stored zlib-compressed in raw_data_compressed; the legacy
+    JSONB raw_data column is cleared. Read them back via Transcript.segments.
 
-# --- Tag Operations ---
+    Runs as a single INSERT ... ON CONFLICT (video_id) DO UPDATE ... RETURNING.
+    """
+    stmt = insert(Transcript).values(
+        video_id=video_id,
+        raw_data=None,
+        raw_data_compressed=compress_json(raw_data),
+        full_text=full_text,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Transcript.video_id],
+        set_={
+            "raw_data": stmt.excluded.raw_data,
+            "raw_data_compressed": stmt.excluded.raw_data_compressed,
+            "full_text": stmt.excluded.full_text,
+        },
+    ).returning(Transcript)
+
+    return session.execute(
+        stmt, execution_options={"populate_existing": True}
+    ).scalar_one()
 
-def get_or_create_tag(session: Session, name: str) -> Tag:
-    """Get existing tag or create new one."""
-    tag = session.query(Tag).filter(Tag.name == name).first()
-    if not tag:
-        tag = Tag(name=name)
-        session.add(tag)
-        session.flush()
-    return tag
 
+# --- Tag Operations ---
 
 def get_or_create_tags(session: Session, names: list[str]) -> list[Tag]:
-    """Get or create multiple tags."""
-    return [get_or_create_tag(session, name) for name in names]
-
+    """
+    Get or create multiple tags.
 
-# --- QA Item Operations ---
+    Looks up all names with a single IN query and inserts only the missing
+    ones (ON CONFLICT DO NOTHING, so concurrent writers can't collide),
+    instead of a SELECT + INSERT per tag.
 
-def upsert_qa_item(
-    session: Session,
-    video_id,
-    timestamp_text: str,
-    timestamp_seconds: int,
-    question: str,
-    answer: Optional[str] = None,
-    answer_preview: Optional[str] = None,
-    category: Optional[str] = None,
-    subcategory: Optional[str] = None,
-    tags: Optional[list[str]] = None,
-    passages: Optional[list[str]] = None,
-) -> QAItem:
-    """
-    Insert or update a Q&A item.
-    Uniqueness is based on (video_id, timestamp_seconds).
-    """
-    qa_item = session.query(QAItem).filter(
-        QAItem.video_id == video_id,
-        QAItem.timestamp_seconds == timestamp_seconds
-    ).first()
-    
-    if qa_item:
-        # Update existing
-        setattr(qa_item, "timestamp_text", timestamp_text)
-        setattr(qa_item, "question", question)
-        setattr(qa_item, "answer", answer)
-        setattr(qa_item, "answer_preview", answer_preview)
-        setattr(qa_item, "category", category)
-        setattr(qa_item, "subcategory", subcategory)
-        # Passages: None = leave untouched, [] = clear, [...] = replace.
-        if passages is not None:
-            setattr(qa_item, "passages", passages)
-    else:
-        # Insert new. Column is NOT NULL; default to [] when caller passes None.
-        qa_item = QAItem(
-            video_id=video_id,
-            timestamp_text=timestamp_text,
-            timestamp_seconds=timestamp_seconds,
-            question=question,
-            answer=answer,
-            answer_preview=answer_preview,
-            category=category,
-            subcategory=subcategory,
-            passages=passages if passages is not None else [],
+    Returns:
+        Tags in the order of first appearance in `names` (duplicates dropped)
+    """
+    unique_names = list(dict.fromkeys(names))
+    if not unique_names:
+        return []
+
+    existing = {
+        tag.name: tag
+        for tag in session.query(Tag).filter(Tag.name.in_(unique_names)).all()
+    }
+    missing = [name for name in unique_names if name not in existing]
+    if missing:
+        session.execute(
+            insert(Tag)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+        )
+        existing.update(
+            (tag.name, tag)
+            for tag in session.query(Tag).filter(Tag.name.in_(missing)).all()
         )
-        session.add(qa_item)
 
-    session.flush()
+    return [existing[name] for name in unique_names]
 
-    # Handle tags. Pass None to leave existing tags untouched; pass a list
-    # (including []) to replace them. An empty list clears stale tags on
-    # reprocess/reclassification.
-    if tags is not None:
-        tag_objects = get_or_create_tags(session, tags) if tags else []
-        setattr(qa_item, "tags", tag_objects)
-        session.flush()
 
-    return qa_item
+def get_or_create_tags_bulk(session: Session, names: list[str]) -> dict[str, UUID]:
+    """
+    Get or create many tags and return their IDs.
+
+    Returns:
+        Mapping of tag name to tag ID
+    """
+    return {tag.name: tag.id for tag in get_or_create_tags(session, names)}
+
 
+# --- QA Item Operations ---
 
 def bulk_upsert_qa_items(
     session: Session,
     video_id,
     items: list[dict],
-) -> list[QAItem]:
+) -> list[UUID]:
     """
     Bulk insert/update Q&A items for a video.
+
+    Writes all rows with a single INSERT ... ON CONFLICT (video_id,
+    timestamp_seconds) DO UPDATE, then resolves and relinks tags with a
+    handful of set-based statements, instead of several round-trips per item.
     
     Each item should have:
     - timestamp_text: str
@@ -197,59 +195,417 @@ def bulk_upsert_qa_items(
     - category: Optional[str]
     - subcategory: Optional[str]
     - tags: Optional[list[str]]
+    - passages: Optional[list[str]]
+
+    Tags and passages: None leaves the stored value untouched (new rows get
+    no tags and an empty passages list), a list (including []) replaces it.
+
+    Returns:
+        IDs of the upserted Q&A items, in input order
     """
-    results = []
-    for item in items:
-        qa = upsert_qa_item(
-            session=session,
-            video_id=video_id,
-            timestamp_text=item["timestamp_text"],
-            timestamp_seconds=item["timestamp_seconds"],
-            question=item["question"],
-            answer=item.get("answer"),
-            answer_preview=item.get("answer_preview"),
-            category=item.get("category"),
-            subcategory=item.get("subcategory"),
-            tags=item.get("tags"),
-            passages=item.get("passages"),
-        )
-        results.append(qa)
-    return results
+    if not items:
+        # Still refresh, so a video with no (or no longer any) Q&A items
+        # gets qa_count 0 and empty facets instead of stale/NULL ones.
+        refresh_video_summaries(session, [video_id])
+        return []
+
+    # Postgres refuses to update the same row twice in one ON CONFLICT
+    # statement, so collapse duplicate timestamps (last one wins, as it did
+    # with sequential upserts).
+    by_timestamp = {item["timestamp_seconds"]: item for item in items}
+
+    # Rows that carry passages and rows that don't need different SET
+    # clauses, so they go out as (at most) two statements.
+    rows_with_passages = []
+    rows_without_passages = []
+    for item in by_timestamp.values():
+        row = {
+            "video_id": video_id,
+            "timestamp_text": item["timestamp_text"],
+            "timestamp_seconds": item["timestamp_seconds"],
+            "question": item["question"],
+            "answer": item.get("answer"),
+            "answer_preview": item.get("answer_preview"),
+            "category": item.get("category"),
+            "subcategory": item.get("subcategory"),
+        }
+        if item.get("passages") is not None:
+            row["passages"] = item["passages"]
+            rows_with_passages.append(row)
+        else:
+            rows_without_passages.append(row)
+
+    ids_by_timestamp: dict[int, UUID] = {}
+    for rows in (rows_with_passages, rows_without_passages):
+        if not rows:
+            continue
+        stmt = insert(QAItem).values(rows)
+        update_columns = [key for key in rows[0] if key not in ("video_id", "timestamp_seconds")]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[QAItem.video_id, QAItem.timestamp_seconds],
+            set_={key: stmt.excluded[key] for key in update_columns},
+        ).returning(QAItem.id, QAItem.timestamp_seconds)
+        for qa_id, timestamp_seconds in session.execute(stmt):
+            ids_by_timestamp[timestamp_seconds] = qa_id
+
+    # Replace tag links for every item that supplied a tag list.
+    _replace_tag_links(session, {
+        ids_by_timestamp[timestamp_seconds]: item["tags"]
+        for timestamp_seconds, item in by_timestamp.items()
+        if item.get("tags") is not None
+    })
+
+    refresh_video_summaries(session, [video_id])
+
+    return [ids_by_timestamp[item["timestamp_seconds"]] for item in items]
+
+
+def update_qa_classifications(session: Session, classifications: dict[UUID, dict]) -> int:
+    """
+    Overwrite the classification of existing Q&A items.
+
+    Used to apply results that arrive after the items were written (e.g.
+    from a Gemini batch job). IDs that no longer exist are skipped.
+
+    Args:
+        session: Database session
+        classifications: Q&A item ID -> dict with category, subcategory,
+            tags and passages
+
+    Returns:
+        Number of items updated
+    """
+    if not classifications:
+        return 0
+
+    existing = set(session.scalars(
+        select(QAItem.id).where(QAItem.id.in_(list(classifications)))
+    ))
+    if not existing:
+        return 0
+
+    # Bulk UPDATE by primary key (one executemany).
+    session.execute(update(QAItem), [
+        {
+            "id": qa_id,
+            "category": classifications[qa_id].get("category"),
+            "subcategory": classifications[qa_id].get("subcategory"),
+            "passages": classifications[qa_id].get("passages") or [],
+        }
+        for qa_id in existing
+    ])
+    _replace_tag_links(session, {
+        qa_id: classifications[qa_id].get("tags") or [] for qa_id in existing
+    })
+    refresh_video_summaries(session, list(session.scalars(
+        select(QAItem.video_id).where(QAItem.id.in_(list(existing))).distinct()
+    )))
+    return len(existing)
+
+
+_REFRESH_SUMMARIES_SQL = text("""
+    UPDATE videos v
+    SET (qa_count, categories, subcategories, tags) = (
+        SELECT
+            COUNT(*),
+            COALESCE(ARRAY_AGG(DISTINCT q.category) FILTER (WHERE q.category IS NOT NULL), '{}'),
+            COALESCE(ARRAY_AGG(DISTINCT q.subcategory) FILTER (WHERE q.subcategory IS NOT NULL), '{}'),
+            COALESCE((
+                SELECT ARRAY_AGG(DISTINCT t.name)
+                FROM qa_items q2
+                JOIN qa_item_tags qt ON qt.qa_item_id = q2.id
+                JOIN tags t ON t.id = qt.tag_id
+                WHERE q2.video_id = v.id
+            ), '{}')
+        FROM qa_items q
+        WHERE q.video_id = v.id
+    )
+    WHERE v.id = ANY(:video_ids)
+""").bindparams(bindparam("video_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+def refresh_video_summaries(session: Session, video_ids: list[UUID]) -> None:
+    """
+    Recompute the stored Q&A aggregates (qa_count, categories,
+    subcategories, tags) of the given videos in one UPDATE.
+
+    Called by the Q&A write paths so /v1/videos/summary can read the
+    columns instead of aggregating on every request.
+    """
+    if video_ids:
+        session.execute(_REFRESH_SUMMARIES_SQL, {"video_ids": list(video_ids)})
+
+
+def _replace_tag_links(session: Session, tags_by_item: dict[UUID, list[str]]) -> None:
+    """Replace the tag links of each Q&A item with the given tag names."""
+    if not tags_by_item:
+        return
+
+    session.execute(
+        delete(QAItemTag).where(QAItemTag.qa_item_id.in_(list(tags_by_item)))
+    )
+    tag_ids = get_or_create_tags_bulk(
+        session, [name for names in tags_by_item.values() for name in names]
+    )
+    links = [
+        {"qa_item_id": qa_id, "tag_id": tag_ids[name]}
+        for qa_id, names in tags_by_item.items()
+        for name in dict.fromkeys(names)
+    ]
+    if links:
+        session.execute(insert(QAItemTag).values(links).on_conflict_do_nothing())
 
 
 # --- Ingest Job Operations ---
 
+# LISTEN/NOTIFY channel that wakes `python -m app.cli.worker --follow`.
+INGEST_JOBS_CHANNEL = "ingest_jobs"
+
+
+def notify_ingest_workers(session: Session) -> None:
+    """
+    Signal listening workers that new jobs are pending.
+
+    Postgres delivers the notification when the transaction commits (and
+    drops it on rollback), so workers never wake for a job they can't see.
+    """
+    session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": INGEST_JOBS_CHANNEL})
+
+
 def create_ingest_job(session: Session, youtube_id: str) -> IngestJob:
     """Create a new ingest job for a video."""
     job = IngestJob(youtube_id=youtube_id)
     session.add(job)
     session.flush()
+    notify_ingest_workers(session)
     return job
 
 
+def create_ingest_jobs_bulk(session: Session, youtube_ids: list[str]) -> list[str]:
+    """
+    Create pending jobs for many videos with a single multi-row INSERT.
+
+    ON CONFLICT DO NOTHING on the partial unique index skips videos that
+    already have an active job (including ones enqueued concurrently).
+
+    Returns:
+        YouTube IDs that got a new job, in input order
+    """
+    unique_ids = list(dict.fromkeys(youtube_ids))
+    if not unique_ids:
+        return []
+
+    stmt = insert(IngestJob).values([
+        {"id": uuid4(), "youtube_id": youtube_id, "status": "pending", "attempts": 0}
+        for youtube_id in unique_ids
+    ]).on_conflict_do_nothing(
+        index_elements=[IngestJob.youtube_id],
+        index_where=IngestJob.status.in_(["pending", "processing"]),
+    ).returning(IngestJob.youtube_id)
+
+    created = set(session.scalars(stmt))
+    if created:
+        notify_ingest_workers(session)
+    return [youtube_id for youtube_id in unique_ids if youtube_id in created]
+
+
+def get_active_job_youtube_ids(session: Session, youtube_ids: list[str]) -> set[str]:
+    """Return the subset of `youtube_ids` with a pending or processing job."""
+    if not youtube_ids:
+        return set()
+    return set(session.scalars(
+        select(IngestJob.youtube_id).where(
+            IngestJob.youtube_id.in_(youtube_ids),
+            IngestJob.status.in_(["pending", "processing"]),
+        )
+    ))
+
+
+def enqueue_ingest_job(session: Session, youtube_id: str) -> bool:
+    """
+    Create a pending job unless the video or any job for it already exists.
+
+    Runs as one INSERT ... SELECT ... WHERE NOT EXISTS ... ON CONFLICT DO
+    NOTHING RETURNING, so the checks and the insert share a round-trip and
+    the partial unique index on active jobs settles concurrent enqueues.
+
+    Returns:
+        True if a job was created
+    """
+    candidate = select(
+        literal(uuid4(), PG_UUID(as_uuid=True)),
+        literal(youtube_id),
+        literal("pending"),
+        literal(0),
+    ).where(
+        ~exists().where(Video.youtube_id == youtube_id),
+        ~exists().where(IngestJob.youtube_id == youtube_id),
+    )
+    stmt = insert(IngestJob).from_select(
+        ["id", "youtube_id", "status", "attempts"], candidate
+    ).on_conflict_do_nothing(
+        index_elements=[IngestJob.youtube_id],
+        index_where=IngestJob.status.in_(["pending", "processing"]),
+    ).returning(IngestJob.id)
+
+    if session.execute(stmt).first() is None:
+        return False
+    notify_ingest_workers(session)
+    return True
+
+
 def get_pending_job(session: Session) -> Optional[IngestJob]:
-    """Get and lock one pending job atomically."""
-    job = session.query(IngestJob).filter(
-        IngestJob.status == "pending"
-    ).order_by(IngestJob.created_at).first()
+    """
+    Get and lock one pending job atomically.
+
+    Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers each claim
+    a different job; the row lock is held until the caller commits the
+    status change.
+    """
+    job = session.execute(
+        select(IngestJob)
+        .where(IngestJob.status == "pending")
+        .order_by(IngestJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar_one_or_none()
     
     if job:
-        setattr(job, "status", "processing")
-        setattr(job, "locked_at", datetime.now(timezone.utc))
-        setattr(job, "attempts", job.attempts + 1)
+        job.status = "processing"
+        job.locked_at = datetime.now(timezone.utc)
+        job.attempts = job.attempts + 1
         session.flush()
     
     return job
 
 
+def claim_pending_job(session: Session) -> Optional[str]:
+    """
+    Claim the oldest pending job in one round trip and return its YouTube ID.
+
+    A single UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED)
+    RETURNING youtube_id, so no IngestJob object is loaded. Use
+    get_pending_job when the caller needs the job row itself.
+    """
+    next_job = (
+        select(IngestJob.id)
+        .where(IngestJob.status == "pending")
+        .order_by(IngestJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(IngestJob)
+        .where(IngestJob.id == next_job)
+        .values(
+            status="processing",
+            locked_at=func.now(),
+            attempts=IngestJob.attempts + 1,
+        )
+        .returning(IngestJob.youtube_id)
+        .execution_options(synchronize_session=False)
+    )
+    return session.execute(stmt).scalar()
+
+
+def claim_pending_jobs(session: Session, limit: int) -> list[tuple[UUID, str, int]]:
+    """
+    Claim up to `limit` of the oldest pending jobs in one round trip.
+
+    Same UPDATE ... RETURNING as claim_pending_job, with the SKIP LOCKED
+    subquery selecting a batch instead of a single row.
+
+    Returns:
+        (job ID, YouTube ID, attempts after this claim) per claimed job,
+        oldest first
+    """
+    if limit < 1:
+        return []
+
+    next_jobs = (
+        select(IngestJob.id)
+        .where(IngestJob.status == "pending")
+        .order_by(IngestJob.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(IngestJob)
+        .where(IngestJob.id.in_(next_jobs.scalar_subquery()))
+        .values(
+            status="processing",
+            locked_at=func.now(),
+            attempts=IngestJob.attempts + 1,
+        )
+        .returning(IngestJob.id, IngestJob.youtube_id, IngestJob.attempts, IngestJob.created_at)
+        .execution_options(synchronize_session=False)
+    )
+    rows = sorted(session.execute(stmt).all(), key=lambda row: row.created_at)
+    return [(row.id, row.youtube_id, row.attempts) for row in rows]
+
+
 def complete_ingest_job(session: Session, job: IngestJob, error: Optional[str] = None):
     """Mark a job as done or failed."""
     if error:
         # Cast to int to satisfy type checker (SQLAlchemy columns are typed as Column[T])
         attempts: int = getattr(job, 'attempts', 0) or 0
-        setattr(job, "status", "failed" if attempts >= 3 else "pending")
-        setattr(job, "last_error", error)
-        setattr(job, "locked_at", None)
+        job.status = "failed" if attempts >= 3 else "pending"
+        job.last_error = error
+        job.locked_at = None
     else:
-        setattr(job, "status", "done")
-    session.flush()
+        job.status = "done"
+
+
+def complete_ingest_jobs(
+    session: Session,
+    outcomes: list[tuple[UUID, int, Optional[str]]],
+) -> None:
+    """
+    Mark many claimed jobs as done or failed with one bulk UPDATE.
+
+    Applies the same rules as complete_ingest_job without loading the rows.
+
+    Args:
+        session: Database session
+        outcomes: (job ID, attempts, error or None) per job, as returned
+            by claim_pending_jobs plus the processing result
+    """
+    if not outcomes:
+        return
+
+    params = []
+    for job_id, attempts, error in outcomes:
+        if error:
+            params.append({
+                "id": job_id,
+                "status": "failed" if attempts >= 3 else "pending",
+                "last_error": error,
+                "locked_at": None,
+            })
+        else:
+            params.append({"id": job_id, "status": "done"})
+
+    # Bulk UPDATE by primary key (one executemany per set of columns).
+    session.execute(update(IngestJob), params)
+
+
+def count_jobs_by_status(session: Session) -> dict[str, int]:
+    """
+    Count ingest jobs per status with a single GROUP BY query.
+
+    Returns:
+        Dict with pending/processing/done/failed counts (0 when absent)
+        and their total
+    """
+    rows = session.execute(
+        select(IngestJob.status, func.count()).group_by(IngestJob.status)
+    ).all()
+    by_status = dict(rows)
+
+    counts = {
+        status: by_status.get(status, 0)
+        for status in ("pending", "processing", "done", "failed")
+    }
+    counts["total"] = sum(counts.values())
+    return counts
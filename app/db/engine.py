@@ -2,6 +2,8 @@
 SQLAlchemy engine and session management.
 """
 
+from functools import lru_cache
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
@@ -10,18 +12,50 @@ from typing import Generator
 from app.settings import get_settings
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB bind values with orjson (C) instead of stdlib json."""
+    return orjson.dumps(value).decode("utf-8")
+
+
+@lru_cache(maxsize=1)
 def get_engine():
-    """Create and return SQLAlchemy engine."""
+    """
+    Return the process-wide SQLAlchemy engine.
+
+    The engine (and its connection pool) is created on first use and then
+    reused, so concurrent workers share warm connections instead of paying
+    a new TCP + TLS handshake to Neon for each one.
+    """
     settings = get_settings()
     return create_engine(
         settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Neon closes idle connections; recycle before it does
+        pool_use_lifo=True,  # Reuse the most recent connection so spares can idle out
         pool_pre_ping=True,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
         echo=False,  # Set to True for SQL debugging
     )
 
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """Return the session factory, binding it to the engine on first use."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def SessionLocal() -> Session:
+    """
+    Create a new session.
+
+    Kept as a callable so existing `SessionLocal()` call sites work, while
+    the engine is only built the first time a session is actually needed
+    (not at import time).
+    """
+    return get_session_factory()()
 
 
 @contextmanager
@@ -4,12 +4,14 @@ SQLAlchemy ORM models matching the Neon database schema.
 
 from sqlalchemy import (
     ARRAY, Column, String, Text, Integer, DateTime, ForeignKey,
-    UniqueConstraint, Index, func
+    LargeBinary, UniqueConstraint, Index, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 import uuid
 
+from app.db.codec import decompress_json
+
 Base = declarative_base()
 
 
@@ -24,15 +26,40 @@ class Video(Base):
     channel_id = Column(Text)
     channel_title = Column(Text)
     published_at = Column(DateTime(timezone=True))
-    description = Column(Text)
+    description = deferred(Column(Text))  # Multi-KB; only the detail endpoint and reprocessing read it
     processed_at = Column(DateTime(timezone=True))
     status = Column(Text, nullable=False, default="pending")
     error = Column(Text)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Q&A aggregates for /v1/videos/summary, refreshed whenever the video's
+    # Q&A items are written (crud.refresh_video_summaries). NULL until then.
+    qa_count = deferred(Column(Integer), group="summary")
+    categories = deferred(Column(ARRAY(Text)), group="summary")
+    subcategories = deferred(Column(ARRAY(Text)), group="summary")
+    tags = deferred(Column(ARRAY(Text)), group="summary")
+    
+    # Relationships. The FKs cascade in the database, so passive_deletes lets
+    # a video delete be a single DELETE instead of loading children first.
+    qa_items = relationship("QAItem", back_populates="video", cascade="all, delete-orphan", passive_deletes=True)
+    transcript = relationship("Transcript", back_populates="video", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
     
-    # Relationships
-    qa_items = relationship("QAItem", back_populates="video", cascade="all, delete-orphan")
-    transcript = relationship("Transcript", back_populates="video", uselist=False, cascade="all, delete-orphan")
+    __table_args__ = (
+        # Trigram index so title ILIKE '%q%' searches don't scan the table
+        # (needs the pg_trgm extension; see migration 005).
+        Index(
+            "idx_videos_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        # Public listings only show processed videos, newest first.
+        Index(
+            "idx_videos_processed_published",
+            published_at.desc(),
+            postgresql_where=text("status = 'processed'"),
+        ),
+    )
     
     def __repr__(self):
         return f"<Video(youtube_id={self.youtube_id}, title={self.title[:50] if self.title is not None else None})>"
@@ -57,11 +84,13 @@ class QAItem(Base):
     
     # Relationships
     video = relationship("Video", back_populates="qa_items")
-    tags = relationship("Tag", secondary="qa_item_tags", back_populates="qa_items")
+    # Every endpoint that returns a QAItem also returns its tag names, so load
+    # them for the whole result set in one extra IN query instead of per row.
+    tags = relationship("Tag", secondary="qa_item_tags", back_populates="qa_items", lazy="selectin", passive_deletes=True)
     
     __table_args__ = (
+        # Also serves lookups by video_id alone (leading column).
         UniqueConstraint("video_id", "timestamp_seconds", name="uq_video_timestamp"),
-        Index("idx_qa_video_id", "video_id"),
     )
     
     def __repr__(self):
@@ -76,7 +105,7 @@ class Tag(Base):
     name = Column(Text, nullable=False, unique=True)
     
     # Relationships
-    qa_items = relationship("QAItem", secondary="qa_item_tags", back_populates="tags")
+    qa_items = relationship("QAItem", secondary="qa_item_tags", back_populates="tags", passive_deletes=True)
     
     def __repr__(self):
         return f"<Tag(name={self.name})>"
@@ -96,12 +125,22 @@ class Transcript(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False, unique=True)
-    raw_data = Column(JSONB)  # Array of {start: float, text: string}
-    full_text = Column(Text)  # Optional concatenated text
+    # The payload columns are deferred: they are large and only read when
+    # reprocessing, which undefers them explicitly.
+    raw_data = deferred(Column(JSONB))  # Legacy: array of {start, duration, text}
+    raw_data_compressed = deferred(Column(LargeBinary))  # zlib-compressed JSON of the same array
+    full_text = deferred(Column(Text))  # Optional concatenated text
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Relationships
     video = relationship("Video", back_populates="transcript")
+
+    @property
+    def segments(self) -> list[dict]:
+        """Transcript segments, from the compressed column or legacy JSONB."""
+        if self.raw_data_compressed is not None:
+            return decompress_json(self.raw_data_compressed)
+        return self.raw_data or []
     
     def __repr__(self):
         return f"<Transcript(video_id={self.video_id})>"
@@ -120,7 +159,20 @@ class IngestJob(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     __table_args__ = (
-        Index("idx_jobs_status", "status"),
+        # Only live jobs are polled; done/failed history stays out of the index.
+        Index(
+            "idx_jobs_status",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+        # At most one active job per video; finished jobs are kept as history.
+        Index(
+            "uq_jobs_active_youtube_id",
+            "youtube_id",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
     )
     
     def __repr__(self):
@@ -2,6 +2,7 @@
 FastAPI dependencies for authentication, database sessions, etc.
 """
 
+import hmac
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, Header, status
 from sqlalchemy.orm import Session
@@ -15,6 +16,11 @@ def get_db() -> Generator[Session, None, None]:
     Database session dependency.
     
     Yields a database session and ensures it's closed after the request.
+
+    Deliberately a plain per-request session rather than a thread-local
+    scoped_session: FastAPI runs sync dependencies and endpoints on
+    threadpool threads that are not pinned to a request, so a thread-local
+    registry could hand the same session to two concurrent requests.
     """
     db = SessionLocal()
     try:
@@ -23,6 +29,11 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _secret_matches(candidate: str, secret: str) -> bool:
+    """Constant-time comparison (bytes, so non-ASCII headers can't raise)."""
+    return hmac.compare_digest(candidate.encode("utf-8"), secret.encode("utf-8"))
+
+
 def verify_api_key(
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
     authorization: Optional[str] = Header(None),
@@ -40,13 +51,13 @@ def verify_api_key(
     
     # Check X-API-Key first (manual calls)
     if x_api_key:
-        if settings.ADMIN_API_KEY and x_api_key == settings.ADMIN_API_KEY:
+        if settings.ADMIN_API_KEY and _secret_matches(x_api_key, settings.ADMIN_API_KEY):
             return x_api_key
     
     # Check Authorization Bearer token (Vercel Cron)
     if authorization and authorization.startswith("Bearer "):
         token = authorization[7:]  # Remove "Bearer " prefix
-        if settings.CRON_SECRET and token == settings.CRON_SECRET:
+        if settings.CRON_SECRET and _secret_matches(token, settings.CRON_SECRET):
             return token
     
     # No valid auth provided
@@ -72,4 +83,4 @@ def optional_api_key(x_api_key: str = Header(None, alias="X-API-Key")) -> bool:
     if not settings.ADMIN_API_KEY or not x_api_key:
         return False
     
-    return x_api_key == settings.ADMIN_API_KEY
+    return _secret_matches(x_api_key, settings.ADMIN_API_KEY)
@@ -4,7 +4,7 @@ Main ingestion pipeline - the "source of truth" for processing videos.
 This module contains the core process_video() function that:
 1. Fetches metadata from YouTube API
 2. Parses timestamps from description
-3. Fetches transcript
+3. Fetches transcript (concurrently with steps 1-2)
 4. Stores raw transcript in database
 5. Slices answers by time windows
 6. Classifies Q&A items (optional)
@@ -12,16 +12,19 @@ This module contains the core process_video() function that:
 """
 
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from typing import Optional
 from datetime import datetime, timezone
 
+from sqlalchemy.orm import load_only, undefer
+
 from app.settings import get_settings
 from app.db.engine import get_session
 from app.db import crud
-from app.db.models import Video, Transcript
+from app.db.models import IngestJob, Video, Transcript
 from app.youtube.ids import get_video_id, build_video_url
-from app.youtube.metadata import get_video_metadata
+from app.youtube.metadata import VideoMetadata, get_video_metadata
 from app.youtube.transcripts import (
     TranscriptSegment,
     get_raw_transcript,
@@ -30,10 +33,10 @@ from app.youtube.transcripts import (
 )
 from app.qa.timestamp_parser import parse_description_timestamps
 from app.qa.answer_slicer import slice_answers_by_timestamps
-from app.qa.classify import classify_question, load_categories
+from app.qa.classify import classify_qa_matches, load_categories
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessResult:
     """Result of processing a single video."""
     youtube_id: str
@@ -45,10 +48,22 @@ class ProcessResult:
     warnings: list[str] = field(default_factory=list)
 
 
+# Shared, long-lived threads for the background transcript fetch, so each
+# thread keeps its transcript client (and warm HTTP session) across videos
+# instead of building a new one per call. Sized to cover the CLIs'
+# default --workers; threads are only started as they are needed.
+TRANSCRIPT_PREFETCH_THREADS = 8
+_transcript_prefetch = ThreadPoolExecutor(
+    max_workers=TRANSCRIPT_PREFETCH_THREADS,
+    thread_name_prefix="transcript-prefetch",
+)
+
+
 def process_video(
     youtube_id_or_url: str,
     skip_classification: bool = False,
     verbose: bool = True,
+    metadata: Optional[VideoMetadata] = None,
 ) -> ProcessResult:
     """
     Process a single YouTube video: extract Q&A and save to database.
@@ -60,6 +75,8 @@ def process_video(
         youtube_id_or_url: YouTube video ID or full URL
         skip_classification: If True, skip LLM classification step
         verbose: If True, print progress messages
+        metadata: Metadata already fetched for this video (e.g. by a
+            batched get_videos_metadata call); fetched here if None
         
     Returns:
         ProcessResult with success status and counts
@@ -81,39 +98,46 @@ def process_video(
     if verbose:
         print(f"Processing: {youtube_id}")
     
-    # Step 1: Fetch metadata
-    if verbose:
-        print("  Fetching metadata...")
-    
-    metadata = get_video_metadata(youtube_id)
-    if not metadata:
-        result.error = "Failed to fetch video metadata"
-        return result
-    
-    result.title = metadata.title
-    
+    # Steps 1 & 3 are independent network calls: start the transcript
+    # fetch in the background and fetch metadata meanwhile.
     if verbose:
-        print(f"  Title: {metadata.title}")
-    
-    # Step 2: Parse timestamps from description
-    if verbose:
-        print("  Parsing timestamps...")
-    
-    questions = parse_description_timestamps(metadata.description)
-    result.questions_found = len(questions)
+        print("  Fetching metadata and transcript...")
     
-    if verbose:
-        print(f"  Found {len(questions)} timestamps")
-    
-    if not questions:
-        result.warnings.append("No timestamps found in description")
-        # Continue anyway - we'll still save the video record
-    
-    # Step 3: Fetch transcript
-    if verbose:
-        print("  Fetching transcript...")
-    
-    transcript = get_raw_transcript(youtube_id)
+    transcript_future = _transcript_prefetch.submit(get_raw_transcript, youtube_id)
+    try:
+        
+        # Step 1: Fetch metadata (unless the caller batched it)
+        if metadata is None:
+            metadata = get_video_metadata(youtube_id)
+        if not metadata:
+            result.error = "Failed to fetch video metadata"
+            return result
+        
+        result.title = metadata.title
+        
+        if verbose:
+            print(f"  Title: {metadata.title}")
+        
+        # Step 2: Parse timestamps from description
+        if verbose:
+            print("  Parsing timestamps...")
+        
+        questions = parse_description_timestamps(metadata.description)
+        result.questions_found = len(questions)
+        
+        if verbose:
+            print(f"  Found {len(questions)} timestamps")
+        
+        if not questions:
+            result.warnings.append("No timestamps found in description")
+            # Continue anyway - we'll still save the video record
+        
+        # Step 3: Wait for the transcript
+        transcript = transcript_future.result()
+    finally:
+        # Drop the fetch on an early return if it hasn't started yet; one
+        # already running finishes on its own without blocking us.
+        transcript_future.cancel()
     
     if not transcript:
         result.error = "Failed to fetch transcript"
@@ -139,29 +163,9 @@ def process_video(
         if verbose:
             print("  Classifying questions...")
         
-        categories = load_categories()
-        
-        for i, qa in enumerate(qa_matches):
-            if verbose:
-                print(f"    [{i+1}/{len(qa_matches)}] {qa.question[:40]}...")
-            
-            classification = classify_question(
-                qa.question,
-                qa.answer,
-                categories,
-            )
-            
-            # Store classification in the match object
-            if classification:
-                qa.category = classification.category
-                qa.subcategory = classification.subcategory
-                qa.tags = classification.tags
-                qa.passages = classification.passages
-            else:
-                qa.category = None
-                qa.subcategory = None
-                qa.tags = []
-                qa.passages = []
+        # All questions are classified concurrently; results are stored
+        # on the match objects.
+        classify_qa_matches(qa_matches, load_categories())
     else:
         # No classification - set empty values
         for qa in qa_matches:
@@ -198,20 +202,11 @@ def process_video(
             )
             
             # Save Q&A items
-            for qa in qa_matches:
-                crud.upsert_qa_item(
-                    session=session,
-                    video_id=video.id,
-                    timestamp_text=qa.timestamp_text,
-                    timestamp_seconds=qa.timestamp_seconds,
-                    question=qa.question,
-                    answer=qa.answer,
-                    answer_preview=qa.answer_preview,
-                    category=qa.category,
-                    subcategory=qa.subcategory,
-                    tags=qa.tags,
-                    passages=qa.passages,
-                )
+            crud.bulk_upsert_qa_items(
+                session,
+                video.id,
+                [asdict(qa) for qa in qa_matches],
+            )
 
             # Mark as processed
             crud.mark_video_processed(session, video)
@@ -231,24 +226,35 @@ def process_video(
     return result
 
 
-def process_video_from_job(youtube_id: str, skip_classification: bool = False) -> ProcessResult:
+def process_video_from_job(
+    youtube_id: str,
+    skip_classification: bool = False,
+    verbose: bool = True,
+) -> ProcessResult:
     """
     Process a video from an ingest job, updating job status.
     
     Args:
         youtube_id: YouTube video ID
         skip_classification: If True, skip LLM classification
+        verbose: If True, print progress messages
         
     Returns:
         ProcessResult
     """
-    result = process_video(youtube_id, skip_classification=skip_classification)
+    result = process_video(
+        youtube_id,
+        skip_classification=skip_classification,
+        verbose=verbose,
+    )
     
     # Update job status in database
     with get_session() as session:
-        from app.db.models import IngestJob
-        
-        job = session.query(IngestJob).filter(
+        # complete_ingest_job only reads attempts; the other columns it
+        # touches are written, which doesn't require loading them.
+        job = session.query(IngestJob).options(
+            load_only(IngestJob.id, IngestJob.attempts),
+        ).filter(
             IngestJob.youtube_id == youtube_id,
             IngestJob.status == "processing"
         ).first()
@@ -280,7 +286,9 @@ def reprocess_from_stored_transcript(
 
     try:
         with get_session() as session:
-            video = session.query(Video).filter(
+            video = session.query(Video).options(
+                undefer(Video.description),
+            ).filter(
                 Video.youtube_id == youtube_id,
             ).first()
 
@@ -290,18 +298,22 @@ def reprocess_from_stored_transcript(
 
             result.title = video.title
 
-            transcript_row = session.query(Transcript).filter(
+            transcript_row = session.query(Transcript).options(
+                undefer(Transcript.raw_data),
+                undefer(Transcript.raw_data_compressed),
+            ).filter(
                 Transcript.video_id == video.id,
             ).first()
 
-            if not transcript_row or not transcript_row.raw_data:
+            stored_segments = transcript_row.segments if transcript_row else []
+            if not stored_segments:
                 result.error = "No stored transcript found"
                 return result
 
             if verbose:
                 print(f"Re-processing: {youtube_id} ({video.title})")
 
-            # Convert stored JSONB back to TranscriptSegment objects.
+            # Convert stored segments back to TranscriptSegment objects.
             # Older rows were serialized without `duration`; fall back to a
             # positive value so `slice_answers_by_timestamps` doesn't drop the
             # final segment (it uses last_seg.start + duration as the end
@@ -312,7 +324,7 @@ def reprocess_from_stored_transcript(
                     duration=seg.get("duration") or 5.0,
                     text=seg["text"],
                 )
-                for seg in transcript_row.raw_data
+                for seg in stored_segments
             ]
 
             # Parse timestamps from stored description
@@ -340,28 +352,7 @@ def reprocess_from_stored_transcript(
                 if verbose:
                     print("  Classifying questions...")
 
-                categories = load_categories()
-
-                for i, qa in enumerate(qa_matches):
-                    if verbose:
-                        print(f"    [{i+1}/{len(qa_matches)}] {qa.question[:40]}...")
-
-                    classification = classify_question(
-                        qa.question,
-                        qa.answer,
-                        categories,
-                    )
-
-                    if classification:
-                        qa.category = classification.category
-                        qa.subcategory = classification.subcategory
-                        qa.tags = classification.tags
-                        qa.passages = classification.passages
-                    else:
-                        qa.category = None
-                        qa.subcategory = None
-                        qa.tags = []
-                        qa.passages = []
+                classify_qa_matches(qa_matches, load_categories())
             else:
                 for qa in qa_matches:
                     qa.category = None
@@ -370,20 +361,11 @@ def reprocess_from_stored_transcript(
                     qa.passages = []
 
             # Upsert Q&A items
-            for qa in qa_matches:
-                crud.upsert_qa_item(
-                    session=session,
-                    video_id=video.id,
-                    timestamp_text=qa.timestamp_text,
-                    timestamp_seconds=qa.timestamp_seconds,
-                    question=qa.question,
-                    answer=qa.answer,
-                    answer_preview=qa.answer_preview,
-                    category=qa.category,
-                    subcategory=qa.subcategory,
-                    tags=qa.tags,
-                    passages=qa.passages,
-                )
+            crud.bulk_upsert_qa_items(
+                session,
+                video.id,
+                [asdict(qa) for qa in qa_matches],
+            )
 
             crud.mark_video_processed(session, video)
             result.questions_saved = len(qa_matches)
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from mcp.server.transport_security import TransportSecuritySettings
 
@@ -52,6 +53,9 @@ Ingestion endpoints (POST) require an `X-API-Key` header.
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # orjson (already a dependency) renders the list endpoints' JSON
+    # several times faster than the stdlib encoder.
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+import orjson
 from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
@@ -108,11 +109,9 @@ _READ_ONLY = ToolAnnotations(readOnlyHint=True, destructiveHint=False, openWorld
 )
 def topics_resource() -> str:
     """Return the full topic taxonomy as JSON."""
-    import json
-
     with get_session() as session:
         data = list_archive_topics(session, tag_limit=200)
-    return json.dumps(data)
+    return orjson.dumps(data).decode("utf-8")
 
 
 @archive_mcp.tool(annotations=_READ_ONLY)
@@ -2,6 +2,7 @@
 Slice transcript into answer segments based on timestamps.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional
 
@@ -9,7 +10,7 @@ from app.qa.timestamp_parser import ParsedTimestamp
 from app.youtube.transcripts import TranscriptSegment
 
 
-@dataclass
+@dataclass(slots=True)
 class QAMatch:
     """A matched question with its answer from the transcript."""
     timestamp_text: str
@@ -24,6 +25,35 @@ class QAMatch:
     passages: Optional[list[str]] = None
 
 
+def _time_ordered(transcript: list[TranscriptSegment]) -> list[TranscriptSegment]:
+    """Transcripts arrive in time order; sort (stably) only if one doesn't."""
+    if any(a.start > b.start for a, b in zip(transcript, transcript[1:])):
+        return sorted(transcript, key=lambda seg: seg.start)
+    return transcript
+
+
+def segment_start_times(transcript: list[TranscriptSegment]) -> list[float]:
+    """
+    Start times of a time-ordered transcript, for repeated window lookups.
+
+    Build once per transcript and pass to slice_answer_for_question when
+    slicing several questions from the same video.
+    """
+    return [seg.start for seg in transcript]
+
+
+def _window_text(
+    transcript: list[TranscriptSegment],
+    starts: list[float],
+    start_time: float,
+    end_time: float,
+) -> str:
+    """Join the text of segments with start_time <= start < end_time."""
+    lo = bisect_left(starts, start_time)
+    hi = bisect_left(starts, end_time)
+    return " ".join(seg.text for seg in transcript[lo:hi])
+
+
 def slice_answers_by_timestamps(
     questions: list[ParsedTimestamp],
     transcript: list[TranscriptSegment],
@@ -47,27 +77,28 @@ def slice_answers_by_timestamps(
     """
     if not questions or not transcript:
         return []
+
+    # Last question runs to the end of the final transcript segment.
+    last_seg = transcript[-1]
+    video_end = last_seg.start + getattr(last_seg, 'duration', 60)
+
+    # Binary-search each time window on the segment start times instead of
+    # scanning the whole transcript per question.
+    transcript = _time_ordered(transcript)
+    starts = segment_start_times(transcript)
     
     results = []
     
     for i, q in enumerate(questions):
         start_time = q.seconds
         
-        # End time is next question's start, or infinity for last question
+        # End time is next question's start, or end of video for last question
         if i + 1 < len(questions):
             end_time = questions[i + 1].seconds
         else:
-            # Use last transcript segment's end time
-            last_seg = transcript[-1]
-            end_time = last_seg.start + getattr(last_seg, 'duration', 60)
-        
-        # Collect transcript lines in this time window
-        answer_parts = []
-        for segment in transcript:
-            if segment.start >= start_time and segment.start < end_time:
-                answer_parts.append(segment.text)
+            end_time = video_end
         
-        full_answer = " ".join(answer_parts)
+        full_answer = _window_text(transcript, starts, start_time, end_time)
         
         # Generate preview
         if len(full_answer) > preview_length:
@@ -90,6 +121,7 @@ def slice_answer_for_question(
     question: ParsedTimestamp,
     next_question: Optional[ParsedTimestamp],
     transcript: list[TranscriptSegment],
+    starts: Optional[list[float]] = None,
 ) -> str:
     """
     Get the answer text for a single question.
@@ -98,6 +130,8 @@ def slice_answer_for_question(
         question: The current question
         next_question: The next question (or None if last)
         transcript: Full transcript segments
+        starts: Optional segment_start_times(transcript), to avoid rebuilding
+            it on every call (the transcript must then be in time order)
         
     Returns:
         Answer text from transcript
@@ -113,10 +147,9 @@ def slice_answer_for_question(
             end_time = last_seg.start + getattr(last_seg, 'duration', 60)
         else:
             end_time = float('inf')
+
+    if starts is None:
+        transcript = _time_ordered(transcript)
+        starts = segment_start_times(transcript)
     
-    answer_parts = []
-    for segment in transcript:
-        if segment.start >= start_time and segment.start < end_time:
-            answer_parts.append(segment.text)
-    
-    return " ".join(answer_parts)
+    return _window_text(transcript, starts, start_time, end_time)
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from app.settings import get_settings
+from app.qa.gemini import get_client, types
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +18,7 @@ async def extract_search_query(question: str) -> str:
         return question
 
     try:
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        client = get_client()
 
         response = await client.aio.models.generate_content(
             model="gemini-3-flash-preview",
@@ -58,10 +56,7 @@ async def generate_grounded_answer(question: str, sources: list[dict]) -> Option
         return None
 
     try:
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        client = get_client()
 
         formatted_sources = []
         for index, source in enumerate(sources, start=1):
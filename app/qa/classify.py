@@ -3,27 +3,74 @@ Classification of Q&A items using Gemini LLM.
 """
 
 import os
-import json
-from typing import Optional, List
-from pydantic import BaseModel, Field
+import logging
+import time
+import asyncio
+import hashlib
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.settings import get_settings
+from app.qa import classify_cache
+from app.qa.gemini import estimate_tokens, genai, get_client, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "gemini-3-flash-preview"
+
+# Part of the classification cache key: bump whenever the prompt text or
+# response schema changes so cached results from the old prompt are ignored.
+PROMPT_VERSION = 3
+
+# Retry policy for rate-limited (HTTP 429 / RESOURCE_EXHAUSTED) requests.
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+
+# Default number of in-flight Gemini requests for the batch classifiers.
+DEFAULT_CONCURRENCY = 8
+
+# Label for items too empty to send to Gemini (see prefilter); both names
+# exist in categories.json.
+_FALLBACK_CATEGORY = "Non-Biblical Questions"
+_FALLBACK_SUBCATEGORY = "Irrelevant Content"
 
 
 class Classification(BaseModel):
-    """Classification result for a Q&A item."""
+    """
+    Classification result for a Q&A item.
+
+    Immutable (and hashable): one instance may be shared between the cache
+    and several callers. Copy tags/passages to lists before storing them.
+    """
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     category: str = Field(description="The main category from the provided list.")
     subcategory: str = Field(description="The subcategory from the provided list.")
-    tags: List[str] = Field(description="A list of relevant tags or topics.")
-    passages: List[str] = Field(
-        default_factory=list,
+    tags: tuple[str, ...] = Field(description="A list of relevant tags or topics.")
+    passages: tuple[str, ...] = Field(
+        default=(),
         description="Bible passages explicitly cited or discussed (e.g., 'Romans 9:10-13', 'Genesis 3'). Empty list if none.",
     )
 
 
+class ClassificationWithId(Classification):
+    """Classification of one item in a row-marshalled batch prompt."""
+    id: int = Field(description="The item's number from the prompt.")
+
+
 def load_categories(filepath: str = "categories.json") -> dict:
     """
     Load category definitions from JSON file.
+
+    The parsed result is cached for the life of the process and shared by
+    every caller, so treat it as read-only. A missing file is not cached,
+    so it is picked up once it appears.
     
     Args:
         filepath: Path to categories.json
@@ -32,45 +79,93 @@ def load_categories(filepath: str = "categories.json") -> dict:
         Dictionary of categories or empty dict if not found
     """
     if not os.path.exists(filepath):
-        print(f"Warning: {filepath} not found.")
+        logger.warning("%s not found.", filepath)
         return {}
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
 
+    return _read_categories(filepath)
 
-def classify_question(
-    question_text: str,
-    answer_text: str,
-    categories_context: Optional[dict] = None,
-) -> Optional[Classification]:
-    """
-    Classify a Q&A pair using Gemini.
-    
-    Args:
-        question_text: The question
-        answer_text: The answer (will be truncated for API)
-        categories_context: Category definitions (loaded from file if None)
-        
-    Returns:
-        Classification object or None if failed
-    """
-    settings = get_settings()
-    
-    if not settings.GEMINI_API_KEY:
-        print("Warning: GEMINI_API_KEY not set, skipping classification")
-        return None
-    
-    try:
-        from google import genai
 
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
-        
-        # Load categories if not provided
-        if categories_context is None:
-            categories_context = load_categories()
-                
-        prompt = f"""You are a theological classification assistant for the YourCalvinist Podcast Q&A database.
+@lru_cache(maxsize=1)
+def _read_categories(filepath: str) -> dict:
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+@dataclass(frozen=True)
+class CategoriesIndex:
+    """categories.json plus everything derived from it, computed once."""
+    raw: dict
+    prompt_json: str  # Compact JSON embedded in every prompt
+    digest: str  # SHA-256 of the canonical JSON, part of the cache key
+    category_names: frozenset[str]
+    subcategory_names: frozenset[str]
+
+    @classmethod
+    def from_dict(cls, categories: dict) -> "CategoriesIndex":
+        return cls(
+            raw=categories,
+            prompt_json=orjson.dumps(categories).decode("utf-8"),
+            digest=hashlib.sha256(
+                orjson.dumps(categories, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest(),
+            category_names=frozenset(categories),
+            subcategory_names=frozenset(
+                name
+                for subcategories in categories.values()
+                if isinstance(subcategories, dict)
+                for name in subcategories
+            ),
+        )
+
+    def unknown_labels(self, classification: Classification) -> list[str]:
+        """Category/subcategory names in `classification` not in the list."""
+        unknown = []
+        if self.category_names and classification.category not in self.category_names:
+            unknown.append(classification.category)
+        if self.subcategory_names and classification.subcategory not in self.subcategory_names:
+            unknown.append(classification.subcategory)
+        return unknown
+
+
+# (categories dict, index) for the last categories object seen. Callers pass
+# the same cached dict for every item, so the index is built once rather
+# than per prompt.
+_categories_index: Optional[tuple[dict, CategoriesIndex]] = None
+
+
+def get_categories_index(categories_context: dict) -> CategoriesIndex:
+    """Return the CategoriesIndex for a categories dict (memoized)."""
+    global _categories_index
+
+    cached = _categories_index
+    if cached is not None and cached[0] is categories_context:
+        return cached[1]
+
+    index = CategoriesIndex.from_dict(categories_context)
+    _categories_index = (categories_context, index)
+    return index
+
+
+def invalidate_categories_cache() -> None:
+    """Forget the loaded categories so the next call re-reads categories.json."""
+    global _categories_index
+
+    _read_categories.cache_clear()
+    _categories_index = None
+
+
+def check_labels(classification: Optional[Classification], categories_context: dict) -> None:
+    """Log classifications whose labels aren't in categories.json."""
+    if classification is None:
+        return
+    unknown = get_categories_index(categories_context).unknown_labels(classification)
+    if unknown:
+        logger.warning("Classification used unlisted label(s): %s", ", ".join(unknown))
+
+
+def _prompt_header(categories_context: dict) -> str:
+    """Shared system/context/categories section of the classification prompts."""
+    return f"""You are a theological classification assistant for the YourCalvinist Podcast Q&A database.
 
 ## CONTEXT
 This is a Q&A podcast hosted by Keith Foskey, a Reformed Baptist pastor at Sovereign Grace Family Church in Jacksonville, Florida. He holds to the First London Baptist Confession (1646). The podcast features live Q&A sessions where viewers submit theological and practical questions.
@@ -88,12 +183,12 @@ Focus on the THEOLOGICAL or PRACTICAL SUBSTANCE of the answer, ignoring promotio
 
 ## CATEGORIES
 You MUST select category and subcategory names EXACTLY as they appear below:
-{json.dumps(categories_context, indent=2)}
+{get_categories_index(categories_context).prompt_json}
 
-## YOUR TASK
-Given the question and answer below, provide:
+"""
 
-1. **category**: Select the TOP-LEVEL category that best fits (e.g., "Theology", "Practical Christian Living", "Church Practices", etc.). Use EXACT names from the list above.
+
+_FIELD_INSTRUCTIONS = """1. **category**: Select the TOP-LEVEL category that best fits (e.g., "Theology", "Practical Christian Living", "Church Practices", etc.). Use EXACT names from the list above.
 
 2. **subcategory**: Select the most appropriate subcategory under your chosen category (e.g., "Soteriology", "Family and Relationships"). Use EXACT names from the list above.
 
@@ -103,7 +198,15 @@ Given the question and answer below, provide:
    - Practical topics (e.g., "sermon preparation", "church membership")
    - Do NOT include Bible passage references here — use the passages field instead.
 
-4. **passages**: List any specific Bible passages (book + chapter, or book + chapter:verse(s)) that are explicitly cited, quoted, or substantively discussed in the answer. Use standard book names and formatting (e.g., "Romans 9:10-13", "1 John 2:15-17", "Genesis 3", "Psalm 119:105"). If no specific passages are cited, return an empty list. Do NOT include vague references like "the Bible says" — only specific citations.
+4. **passages**: List any specific Bible passages (book + chapter, or book + chapter:verse(s)) that are explicitly cited, quoted, or substantively discussed in the answer. Use standard book names and formatting (e.g., "Romans 9:10-13", "1 John 2:15-17", "Genesis 3", "Psalm 119:105"). If no specific passages are cited, return an empty list. Do NOT include vague references like "the Bible says" — only specific citations."""
+
+
+def build_prompt(question_text: str, answer_text: str, categories_context: dict) -> str:
+    """Build the classification prompt for a single Q&A pair."""
+    return _prompt_header(categories_context) + f"""## YOUR TASK
+Given the question and answer below, provide:
+
+{_FIELD_INSTRUCTIONS}
 
 ## QUESTION
 {question_text}
@@ -112,40 +215,460 @@ Given the question and answer below, provide:
 {answer_text}
 
 Respond with valid JSON matching the schema. If the content is primarily sponsor material, live chat banter, or completely off-topic, use category "Non-Biblical Questions" with appropriate subcategory."""
-        
-        response = client.models.generate_content(
-            model="gemini-3-flash-preview",
-            contents=prompt,
-            config={
-                "response_mime_type": "application/json",
-                "response_schema": Classification,
-            },
+
+
+def _build_batch_prompt(pairs: list[tuple[str, str]], categories_context: dict) -> str:
+    """
+    Build one prompt classifying several Q&A pairs ("row-marshalled").
+
+    The header and categories are sent once; items are numbered from 0 and
+    the model echoes each number back as `id`.
+    """
+    items = "\n\n".join(
+        f"""## ITEM {i}
+### QUESTION
+{question_text}
+
+### ANSWER (from transcript, may contain extraneous content)
+{answer_text}"""
+        for i, (question_text, answer_text) in enumerate(pairs)
+    )
+    return _prompt_header(categories_context) + f"""## YOUR TASK
+Below are {len(pairs)} numbered question-and-answer items. Classify EACH item independently (do not let one item's content influence another) and provide:
+
+{_FIELD_INSTRUCTIONS}
+
+Return a JSON array with exactly one object per item, with `id` set to the item's number.
+
+{items}
+
+Respond with valid JSON matching the schema. If an item's content is primarily sponsor material, live chat banter, or completely off-topic, use category "Non-Biblical Questions" with appropriate subcategory for that item."""
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Return True if the error is a Gemini 429 / quota exhaustion."""
+    if getattr(error, "code", None) == 429:
+        return True
+    text = str(error)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: base * 2**attempt, capped."""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+def _generation_config() -> dict:
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": Classification,
+    }
+
+
+def _batch_generation_config() -> dict:
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": list[ClassificationWithId],
+    }
+
+
+def _parse_response(response) -> Optional[Classification]:
+    json_text = response.text
+    if not json_text:
+        logger.warning("Classification returned empty response.")
+        return None
+    return Classification.model_validate_json(json_text)
+
+
+def prefilter(question_text: str, answer_text: str) -> Optional[Classification]:
+    """
+    Label items with nothing to classify without calling Gemini.
+
+    An empty question or an answer under MIN_ANSWER_CHARS_FOR_LLM (e.g. a
+    timestamp whose transcript window came out empty) would only get the
+    prompt's off-topic fallback anyway.
+    """
+    min_chars = get_settings().MIN_ANSWER_CHARS_FOR_LLM
+    if min_chars <= 0:
+        return None
+    if not question_text.strip() or len((answer_text or "").strip()) < min_chars:
+        return Classification(
+            category=_FALLBACK_CATEGORY,
+            subcategory=_FALLBACK_SUBCATEGORY,
+            tags=(),
         )
-        
-        json_text = response.text
-        if not json_text:
-            print("Classification returned empty response.")
-            return None
-        
+    return None
+
+
+def _cache_key(question_text: str, answer_text: str, categories_context: dict) -> Optional[str]:
+    """Classification cache key, or None when the cache is disabled."""
+    if not classify_cache.is_enabled():
+        return None
+    categories_digest = get_categories_index(categories_context).digest
+    return classify_cache.make_key(
+        MODEL_NAME, str(PROMPT_VERSION), categories_digest, question_text, answer_text
+    )
+
+
+def _get_cached_classification(key: Optional[str]) -> Optional[Classification]:
+    if key is None:
+        return None
+    json_text = classify_cache.get_cached(key)
+    if not json_text:
+        return None
+    try:
         return Classification.model_validate_json(json_text)
+    except Exception:
+        return None  # Stale/corrupt entry; classify again
+
+
+def _store_classification(key: Optional[str], classification: Optional[Classification]) -> None:
+    if key is not None and classification is not None:
+        classify_cache.store(key, classification.model_dump_json(include=set(Classification.model_fields)))
+
+
+def classify_question(
+    question_text: str,
+    answer_text: str,
+    categories_context: Optional[dict] = None,
+) -> Optional[Classification]:
+    """
+    Classify a Q&A pair using Gemini.
+    
+    Args:
+        question_text: The question
+        answer_text: The answer (will be truncated for API)
+        categories_context: Category definitions (loaded from file if None)
+        
+    Returns:
+        Classification object or None if failed
+    """
+    settings = get_settings()
+    
+    if not settings.GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY not set, skipping classification")
+        return None
+    
+    try:
+        # Load categories if not provided
+        if categories_context is None:
+            categories_context = load_categories()
+
+        prefiltered = prefilter(question_text, answer_text)
+        if prefiltered is not None:
+            return prefiltered
+
+        cache_key = _cache_key(question_text, answer_text, categories_context)
+        cached = _get_cached_classification(cache_key)
+        if cached is not None:
+            return cached
+
+        client = get_client()
+
+        prompt = build_prompt(question_text, answer_text, categories_context)
+
+        for attempt in range(MAX_ATTEMPTS):
+            get_rate_limiter().acquire(estimate_tokens(prompt))
+            try:
+                response = client.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=prompt,
+                    config=_generation_config(),
+                )
+                break
+            except Exception as e:
+                if attempt + 1 < MAX_ATTEMPTS and _is_rate_limit_error(e):
+                    time.sleep(_retry_delay(attempt))
+                    continue
+                raise
+
+        classification = _parse_response(response)
+        check_labels(classification, categories_context)
+        _store_classification(cache_key, classification)
+        return classification
         
     except Exception as e:
-        print(f"Classification Error: {e}")
+        logger.warning("Classification error: %s", e)
         return None
 
 
-def classify_batch(
+async def classify_question_async(
+    question_text: str,
+    answer_text: str,
+    categories_context: Optional[dict] = None,
+    client=None,
+) -> Optional[Classification]:
+    """
+    Async variant of classify_question using the Gemini aio client.
+
+    Rate-limited requests are retried with exponential backoff.
+
+    Args:
+        question_text: The question
+        answer_text: The answer
+        categories_context: Category definitions (loaded from file if None)
+        client: Optional genai.Client to reuse across calls
+
+    Returns:
+        Classification object or None if failed
+    """
+    settings = get_settings()
+
+    if not settings.GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY not set, skipping classification")
+        return None
+
+    try:
+        if categories_context is None:
+            categories_context = load_categories()
+
+        prefiltered = prefilter(question_text, answer_text)
+        if prefiltered is not None:
+            return prefiltered
+
+        cache_key = _cache_key(question_text, answer_text, categories_context)
+        cached = _get_cached_classification(cache_key)
+        if cached is not None:
+            return cached
+
+        if client is None:
+            client = genai.Client(api_key=settings.GEMINI_API_KEY)
+
+        prompt = build_prompt(question_text, answer_text, categories_context)
+
+        for attempt in range(MAX_ATTEMPTS):
+            await get_rate_limiter().acquire_async(estimate_tokens(prompt))
+            try:
+                response = await client.aio.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=prompt,
+                    config=_generation_config(),
+                )
+                break
+            except Exception as e:
+                if attempt + 1 < MAX_ATTEMPTS and _is_rate_limit_error(e):
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                raise
+
+        classification = _parse_response(response)
+        check_labels(classification, categories_context)
+        _store_classification(cache_key, classification)
+        return classification
+
+    except Exception as e:
+        logger.warning("Classification error: %s", e)
+        return None
+
+
+async def _classify_group_async(
+    pairs: list[tuple[str, str]],
+    categories_context: dict,
+    client,
+) -> list[Optional[Classification]]:
+    """
+    Classify several pairs with one row-marshalled request.
+
+    Items the model leaves out (or returns malformed) are classified
+    individually, as is the whole group if the batch request fails.
+    """
+    results: list[Optional[Classification]] = [None] * len(pairs)
+
+    try:
+        prompt = _build_batch_prompt(pairs, categories_context)
+
+        for attempt in range(MAX_ATTEMPTS):
+            await get_rate_limiter().acquire_async(estimate_tokens(prompt))
+            try:
+                response = await client.aio.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=prompt,
+                    config=_batch_generation_config(),
+                )
+                break
+            except Exception as e:
+                if attempt + 1 < MAX_ATTEMPTS and _is_rate_limit_error(e):
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                raise
+
+        for entry in orjson.loads(response.text or "[]"):
+            try:
+                item = ClassificationWithId.model_validate(entry)
+            except Exception:
+                continue
+            if 0 <= item.id < len(pairs) and results[item.id] is None:
+                results[item.id] = item
+                check_labels(item, categories_context)
+                _store_classification(
+                    _cache_key(*pairs[item.id], categories_context), item
+                )
+
+    except Exception as e:
+        logger.warning("Batch classification error, falling back to single items: %s", e)
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        singles = await asyncio.gather(*(
+            classify_question_async(*pairs[i], categories_context, client=client)
+            for i in missing
+        ))
+        for i, result in zip(missing, singles):
+            results[i] = result
+
+    return results
+
+
+async def classify_questions_async(
+    pairs: list[tuple[str, str]],
+    categories_context: Optional[dict] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[Optional[Classification]]:
+    """
+    Classify many Q&A pairs concurrently on the running event loop.
+
+    One genai client is shared by all requests, and at most `concurrency`
+    are in flight at once. With settings.ROW_MARSHAL_BATCH_SIZE > 1, pairs
+    are sent in groups of that size, one request per group.
+
+    Args:
+        pairs: List of (question, answer) tuples
+        categories_context: Category definitions (loaded from file if None)
+        concurrency: Maximum number of in-flight requests
+
+    Returns:
+        One Classification (or None on failure) per pair, in input order
+    """
+    if not pairs:
+        return []
+
+    settings = get_settings()
+    if not settings.GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY not set, skipping classification")
+        return [None] * len(pairs)
+
+    if genai is None:
+        logger.warning("google-genai not installed, skipping classification")
+        return [None] * len(pairs)
+
+    if categories_context is None:
+        categories_context = load_categories()
+
+    # A client per call rather than the shared one: asyncio.run() gives each
+    # call a fresh event loop, and async connections can't outlive theirs.
+    client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    batch_size = settings.ROW_MARSHAL_BATCH_SIZE
+    if batch_size > 1 and len(pairs) > 1:
+        # Row-marshalled: one request per group of `batch_size` pairs that
+        # are neither prefiltered nor cached.
+        results: list[Optional[Classification]] = [
+            prefilter(q, a)
+            or _get_cached_classification(_cache_key(q, a, categories_context))
+            for q, a in pairs
+        ]
+        todo = [i for i, result in enumerate(results) if result is None]
+
+        async def group(indices: list[int]) -> None:
+            async with semaphore:
+                classified = await _classify_group_async(
+                    [pairs[i] for i in indices], categories_context, client
+                )
+            for i, result in zip(indices, classified):
+                results[i] = result
+
+        await asyncio.gather(*(
+            group(todo[i:i + batch_size]) for i in range(0, len(todo), batch_size)
+        ))
+        return results
+
+    async def one(question: str, answer: str) -> Optional[Classification]:
+        async with semaphore:
+            return await classify_question_async(
+                question, answer, categories_context, client=client
+            )
+
+    return await asyncio.gather(*(one(q, a) for q, a in pairs))
+
+
+def classify_questions(
+    pairs: list[tuple[str, str]],
+    categories_context: Optional[dict] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[Optional[Classification]]:
+    """
+    Classify many Q&A pairs concurrently.
+
+    Runs classify_questions_async on a private event loop, so it can be
+    called from synchronous code (including worker threads) but not from
+    inside a running event loop.
+
+    Args:
+        pairs: List of (question, answer) tuples
+        categories_context: Category definitions (loaded from file if None)
+        concurrency: Maximum number of in-flight requests
+
+    Returns:
+        One Classification (or None on failure) per pair, in input order
+    """
+    if not pairs:
+        return []
+
+    return asyncio.run(
+        classify_questions_async(pairs, categories_context, concurrency)
+    )
+
+
+def classify_qa_matches(
+    qa_matches: list,
+    categories_context: Optional[dict] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    """
+    Classify sliced Q&A matches concurrently, storing results on each match.
+
+    Matches whose classification fails get category/subcategory None and
+    empty tags/passages.
+
+    Args:
+        qa_matches: QAMatch objects (modified in place)
+        categories_context: Category definitions (loaded from file if None)
+        concurrency: Maximum number of in-flight Gemini requests
+    """
+    classifications = classify_questions(
+        [(qa.question, qa.answer) for qa in qa_matches],
+        categories_context,
+        concurrency=concurrency,
+    )
+
+    for qa, classification in zip(qa_matches, classifications):
+        if classification:
+            qa.category = classification.category
+            qa.subcategory = classification.subcategory
+            qa.tags = list(classification.tags)
+            qa.passages = list(classification.passages)
+        else:
+            qa.category = None
+            qa.subcategory = None
+            qa.tags = []
+            qa.passages = []
+
+
+async def classify_batch_async(
     items: list[dict],
     categories_context: Optional[dict] = None,
     skip_classification: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> list[dict]:
     """
-    Classify a batch of Q&A items.
+    Classify a batch of Q&A items concurrently.
     
     Args:
         items: List of dicts with 'question' and 'answer' keys
         categories_context: Category definitions
         skip_classification: If True, skip LLM calls entirely
+        concurrency: Maximum number of in-flight Gemini requests
         
     Returns:
         Same items with 'category', 'subcategory', and 'tags' added
@@ -153,28 +676,53 @@ def classify_batch(
     if skip_classification:
         return items
     
-    if categories_context is None:
-        categories_context = load_categories()
+    classifications = await classify_questions_async(
+        [(item.get('question', ''), item.get('answer', '')) for item in items],
+        categories_context,
+        concurrency=concurrency,
+    )
     
-    results = []
-    for item in items:
-        classification = classify_question(
-            item.get('question', ''),
-            item.get('answer', ''),
-            categories_context,
-        )
-        
+    for item, classification in zip(items, classifications):
         if classification:
             item['category'] = classification.category
             item['subcategory'] = classification.subcategory
-            item['tags'] = classification.tags
-            item['passages'] = classification.passages
+            item['tags'] = list(classification.tags)
+            item['passages'] = list(classification.passages)
         else:
             item['category'] = None
             item['subcategory'] = None
             item['tags'] = []
             item['passages'] = []
+    
+    return items
+
+
+def classify_batch(
+    items: list[dict],
+    categories_context: Optional[dict] = None,
+    skip_classification: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict]:
+    """
+    Classify a batch of Q&A items.
+
+    Synchronous wrapper around classify_batch_async; like
+    classify_questions, it must not be called from a running event loop.
+    
+    Args:
+        items: List of dicts with 'question' and 'answer' keys
+        categories_context: Category definitions
+        skip_classification: If True, skip LLM calls entirely
+        concurrency: Maximum number of in-flight Gemini requests
         
-        results.append(item)
+    Returns:
+        Same items with 'category', 'subcategory', and 'tags' added
+    """
+    if skip_classification or not items:
+        return items
     
-    return results
+    return asyncio.run(classify_batch_async(
+        items,
+        categories_context,
+        concurrency=concurrency,
+    ))
@@ -0,0 +1,172 @@
+"""
+Offline classification through the Gemini Batch API.
+
+Reclassifying stored videos isn't latency-sensitive, and batch jobs are
+billed at half the interactive rate. A job is submitted as a JSONL file
+of per-item requests keyed by Q&A item ID; Gemini completes it within
+24 hours and the results are read back by the same keys. Driven by
+`python -m app.cli.batch_classify`.
+"""
+
+import logging
+import os
+import tempfile
+from typing import Optional
+
+import orjson
+
+from app.qa.classify import (
+    MODEL_NAME,
+    Classification,
+    build_prompt,
+    check_labels,
+    load_categories,
+    prefilter,
+)
+from app.qa.gemini import get_client, types
+
+logger = logging.getLogger(__name__)
+
+# Terminal job states (google.genai JobState names).
+SUCCEEDED = "JOB_STATE_SUCCEEDED"
+FINISHED_STATES = frozenset({
+    SUCCEEDED,
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+
+def _request_line(key: str, question_text: str, answer_text: str, categories_context: dict) -> bytes:
+    """One JSONL line: a generateContent request tagged with `key`."""
+    return orjson.dumps({
+        "key": key,
+        "request": {
+            "contents": [{
+                "role": "user",
+                "parts": [{"text": build_prompt(question_text, answer_text, categories_context)}],
+            }],
+            "generation_config": {
+                "response_mime_type": "application/json",
+                "response_json_schema": Classification.model_json_schema(),
+            },
+        },
+    }) + b"\n"
+
+
+def submit_batch(
+    items: list[tuple[str, str, str]],
+    categories_context: Optional[dict] = None,
+    display_name: str = "qa-classification",
+) -> tuple[Optional[str], dict[str, Classification]]:
+    """
+    Upload a classification job for many Q&A items.
+
+    Items the live path wouldn't send to Gemini (see classify.prefilter)
+    are labelled here instead of being included in the job, so batch and
+    live classification agree for the same input.
+
+    Args:
+        items: List of (key, question, answer) tuples; keys must be unique
+            (the Q&A item ID)
+        categories_context: Category definitions (loaded from file if None)
+        display_name: Label shown in the Gemini console
+
+    Returns:
+        (job name, prefiltered): the batch job name used to poll and fetch
+        results (None if every item was prefiltered), and key ->
+        Classification for the prefiltered items
+    """
+    prefiltered: dict[str, Classification] = {}
+    to_send = []
+    for key, question_text, answer_text in items:
+        classification = prefilter(question_text, answer_text or "")
+        if classification is not None:
+            prefiltered[key] = classification
+        else:
+            to_send.append((key, question_text, answer_text or ""))
+
+    if not to_send:
+        return None, prefiltered
+
+    if categories_context is None:
+        categories_context = load_categories()
+
+    client = get_client()
+
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for key, question_text, answer_text in to_send:
+                f.write(_request_line(key, question_text, answer_text, categories_context))
+
+        uploaded = client.files.upload(
+            file=path,
+            config=types.UploadFileConfig(display_name=display_name, mime_type="jsonl"),
+        )
+    finally:
+        os.remove(path)
+
+    job = client.batches.create(
+        model=MODEL_NAME,
+        src=uploaded.name,
+        config={"display_name": display_name},
+    )
+    return job.name, prefiltered
+
+
+def get_batch_state(name: str) -> str:
+    """Return the job's state name, e.g. "JOB_STATE_RUNNING"."""
+    return get_client().batches.get(name=name).state.name
+
+
+def _parse_result_line(entry: dict) -> Optional[Classification]:
+    if entry.get("error"):
+        logger.warning("Batch item %s failed: %s", entry.get("key"), entry["error"])
+        return None
+    try:
+        text = entry["response"]["candidates"][0]["content"]["parts"][0]["text"]
+        return Classification.model_validate_json(text)
+    except Exception as e:
+        logger.warning("Batch item %s returned an unusable response: %s", entry.get("key"), e)
+        return None
+
+
+def fetch_batch_results(
+    name: str,
+    categories_context: Optional[dict] = None,
+) -> Optional[dict[str, Optional[Classification]]]:
+    """
+    Read the results of a finished job.
+
+    Args:
+        name: Batch job name returned by submit_batch
+        categories_context: Categories used to flag unlisted labels
+            (loaded from file if None)
+
+    Returns:
+        Key -> Classification (None for items that failed), or None if the
+        job hasn't finished yet. A job that ended without succeeding
+        raises RuntimeError.
+    """
+    client = get_client()
+    job = client.batches.get(name=name)
+    state = job.state.name
+
+    if state not in FINISHED_STATES:
+        return None
+    if state != SUCCEEDED:
+        raise RuntimeError(f"Batch job {name} ended in state {state}")
+
+    if categories_context is None:
+        categories_context = load_categories()
+
+    results: dict[str, Optional[Classification]] = {}
+    for line in client.files.download(file=job.dest.file_name).splitlines():
+        if not line.strip():
+            continue
+        entry = orjson.loads(line)
+        classification = _parse_result_line(entry)
+        check_labels(classification, categories_context)
+        results[entry.get("key")] = classification
+    return results
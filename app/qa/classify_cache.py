@@ -0,0 +1,65 @@
+"""
+Optional on-disk cache for Gemini classifications.
+
+Reprocessing a video (or retrying a failed job) re-classifies the same
+question/answer text, paying full LLM latency and tokens again. When
+CLASSIFY_CACHE_DIR is set, classify.py stores each successful response
+under a SHA-256 key of everything that shapes it (model, prompt version,
+categories, question, answer) and reuses it on the next run. Unset (the
+default, and what the serverless API uses), nothing touches the disk.
+"""
+
+import hashlib
+import threading
+from typing import Optional
+
+from app.settings import get_settings
+
+_SEPARATOR = "\x1f"  # Unit separator: can't be confused with text content
+
+_cache = None
+_opened = False
+_open_lock = threading.Lock()
+
+
+def _get_cache():
+    """Open the cache on first use, or return None if it is disabled."""
+    global _cache, _opened
+
+    if not _opened:
+        with _open_lock:
+            if not _opened:
+                directory = get_settings().CLASSIFY_CACHE_DIR
+                if directory:
+                    # Imported lazily: only deployments that enable the cache
+                    # need diskcache installed.
+                    from diskcache import Cache
+
+                    _cache = Cache(directory)
+                _opened = True
+    return _cache
+
+
+def is_enabled() -> bool:
+    """True if CLASSIFY_CACHE_DIR is configured."""
+    return _get_cache() is not None
+
+
+def make_key(*parts: str) -> str:
+    """Hash the given parts into a cache key."""
+    return hashlib.sha256(_SEPARATOR.join(parts).encode("utf-8")).hexdigest()
+
+
+def get_cached(key: str) -> Optional[str]:
+    """Return the cached response JSON for `key`, or None."""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    return cache.get(key)
+
+
+def store(key: str, json_text: str) -> None:
+    """Cache a response JSON (no expiry; bump the prompt version to invalidate)."""
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(key, json_text)
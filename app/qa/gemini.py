@@ -0,0 +1,108 @@
+"""
+Shared Gemini API client and request budget.
+"""
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+
+from app.settings import get_settings
+
+# Imported once here rather than inside every call. Without the SDK,
+# Gemini-backed features degrade (classification returns None, /v1/ask
+# falls back) instead of breaking imports.
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:
+    genai = None
+    types = None
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Return the process-wide genai.Client, created on first use.
+
+    Reusing one client keeps its HTTP connection pool warm instead of paying
+    a new TLS handshake per request. Its sync interface is thread-safe; use
+    `client.aio` only from a long-lived event loop (e.g. FastAPI's), since
+    pooled async connections are tied to the loop that opened them. Code
+    that spins up its own loop with asyncio.run() should create a client
+    for that loop instead.
+    """
+    if genai is None:
+        raise RuntimeError("google-genai is not installed")
+    return genai.Client(api_key=get_settings().GEMINI_API_KEY)
+
+
+class GeminiRateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    Callers reserve budget up front and then wait out any deficit, so a
+    burst of concurrent classifications is spread to the tier ceiling
+    instead of tripping 429s and backing off blindly. State is guarded by a
+    thread lock rather than an asyncio primitive, so one limiter covers
+    every worker thread and every event loop in the process.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Args:
+            rpm: Requests per minute (0 disables the request budget)
+            tpm: Input tokens per minute (0 disables the token budget)
+        """
+        self.rpm = max(0, rpm)
+        self.tpm = max(0, tpm)
+        self._lock = threading.Lock()
+        self._updated = time.monotonic()
+        # Both buckets start full; a negative balance is debt that later
+        # callers wait out.
+        self._requests = float(self.rpm)
+        self._tokens = float(self.tpm)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take budget for one request and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+
+            delay = 0.0
+            if self.rpm:
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+                self._requests -= 1
+                if self._requests < 0:
+                    delay = max(delay, -self._requests * 60 / self.rpm)
+            if self.tpm:
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+                self._tokens -= min(tokens, self.tpm)
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens * 60 / self.tpm)
+            return delay
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a request of about `tokens` input tokens may be sent."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """Async variant of acquire(); sleeps without blocking the event loop."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def estimate_tokens(prompt: str) -> int:
+    """Rough token count for budgeting: ~4 characters per token plus output."""
+    return len(prompt) // 4 + 512
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> GeminiRateLimiter:
+    """Return the process-wide limiter sized from GEMINI_RPM / GEMINI_TPM."""
+    settings = get_settings()
+    return GeminiRateLimiter(settings.GEMINI_RPM, settings.GEMINI_TPM)
@@ -7,6 +7,10 @@ from typing import Optional
 
 from app.settings import get_settings
 
+_WHITESPACE_RE = re.compile(r'\s+')
+# Common question prefixes like "Q:" or numbered lists ("1." / "2)")
+_QUESTION_PREFIX_RE = re.compile(r'^(?:Q[:.]?\s*|\d+[.)]\s*)', re.IGNORECASE)
+
 
 def normalize_text(text: str) -> str:
     """
@@ -22,7 +26,7 @@ def normalize_text(text: str) -> str:
         return ""
     
     # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -56,14 +60,13 @@ def generate_answer_preview(
     if len(answer) <= max_length:
         return answer
     
-    # Find last space before max_length to avoid cutting words
-    truncated = answer[:max_length]
-    last_space = truncated.rfind(' ')
-    
-    if last_space > max_length * 0.7:  # Only use if not too short
-        truncated = truncated[:last_space]
+    # Cut at the last space before max_length to avoid cutting words, unless
+    # that would drop more than 30% of the preview. Searching the original
+    # string within bounds avoids slicing it twice.
+    last_space = answer.rfind(' ', 0, max_length)
+    end = last_space if last_space > max_length * 7 // 10 else max_length
     
-    return truncated.rstrip('.,;:!? ') + "..."
+    return answer[:end].rstrip('.,;:!? ') + "..."
 
 
 def clean_question_text(text: str) -> str:
@@ -80,7 +83,7 @@ def clean_question_text(text: str) -> str:
         return ""
     
     # Remove common prefixes like "Q:" or numbered lists
-    text = re.sub(r'^(?:Q[:.]?\s*|\d+[.)]\s*)', '', text, flags=re.IGNORECASE)
+    text = _QUESTION_PREFIX_RE.sub('', text)
     
     # Normalize whitespace
     text = normalize_text(text)
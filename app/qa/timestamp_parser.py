@@ -6,6 +6,16 @@ import re
 from dataclasses import dataclass
 
 
+# Cheap pre-screen: descriptions without anything time-like skip the
+# line-by-line parse.
+_HAS_TIMESTAMP = re.compile(r"\d{1,2}:\d{2}")
+
+# 00:00 or 1:00:00, at the start or end of a description line
+_TIME_PATTERN = r"(\d{1,2}:\d{2}(?::\d{2})?)"
+_TIME_START_RE = re.compile(f"^{_TIME_PATTERN}")
+_TIME_END_RE = re.compile(f"{_TIME_PATTERN}$")
+
+
 @dataclass
 class ParsedTimestamp:
     """A parsed timestamp with its question text."""
@@ -76,18 +86,20 @@ def parse_description_timestamps(description_text: str) -> list[ParsedTimestamp]
     Returns:
         List of ParsedTimestamp objects, sorted by time
     """
+    if not _HAS_TIMESTAMP.search(description_text):
+        return []
+
     questions = []
     
-    # Pattern matches 00:00 or 1:00:00 format
-    time_pattern = r"(\d{1,2}:\d{2}(?::\d{2})?)"
-    
     for line in description_text.split('\n'):
-        line = line.strip()
-        if not line:
+        # Most description lines (links, sponsor copy) have no timestamp;
+        # a substring test rejects them without running either regex.
+        if ':' not in line:
             continue
+        line = line.strip()
         
         # Check timestamp at START of line
-        match_start = re.match(f"^{time_pattern}", line)
+        match_start = _TIME_START_RE.match(line)
         if match_start:
             timestamp = match_start.group(1)
             # Remove timestamp and common separators from text
@@ -101,7 +113,7 @@ def parse_description_timestamps(description_text: str) -> list[ParsedTimestamp]
             continue
         
         # Check timestamp at END of line
-        match_end = re.search(f"{time_pattern}$", line)
+        match_end = _TIME_END_RE.search(line)
         if match_end:
             timestamp = match_end.group(1)
             text = line[:match_end.start()].strip(" -|.:")
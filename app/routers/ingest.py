@@ -2,6 +2,8 @@
 Protected ingestion endpoints for cron jobs and admin tasks.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -11,11 +13,13 @@ from app.schemas import (
     IngestRunResponse,
     IngestQueueStats,
 )
-from app.db.models import Video, IngestJob
+from app.db.models import Video
 from app.db import crud
+from app.youtube.metadata import get_videos_metadata
 from app.youtube.playlist import get_playlist_video_ids
 from app.ingest.pipeline import process_video
 from app.ingest.jobs import get_queue_stats
+from app.routers.public import invalidate_metadata_cache
 
 router = APIRouter(
     prefix="/v1/ingest",
@@ -51,8 +55,12 @@ def check_for_new_videos(db: Session = Depends(get_db)):
     return _check_for_new_videos(db)
 
 
+# Videos processed at once by run-batch. Each job is mostly waiting on
+# YouTube and Gemini, so a batch takes about as long as its slowest job.
+BATCH_CONCURRENCY = 5
+
 # Video IDs to skip (known bad IDs, wrong playlist entries, etc.)
-SKIP_VIDEO_IDS = {"4QpzXOyWDrE"}
+SKIP_VIDEO_IDS: frozenset[str] = frozenset({"4QpzXOyWDrE"})
 
 
 def _check_for_new_videos(db: Session) -> IngestCheckResponse:
@@ -68,33 +76,23 @@ def _check_for_new_videos(db: Session) -> IngestCheckResponse:
                 message="No videos found in playlist or API error"
             )
         
-        # Find which ones are new or failed
-        new_ids = []
-        for youtube_id in playlist_ids:
-            # Skip known bad video IDs
-            if youtube_id in SKIP_VIDEO_IDS:
-                continue
-            
-            # Check if video exists and is successfully processed
-            existing_video = crud.get_video_by_youtube_id(db, youtube_id)
-            if existing_video is not None:
-                video_status = getattr(existing_video, 'status', '')
-                if video_status == 'processed':
-                    # Video already successfully processed, skip
-                    continue
-            
-            # Check if job already exists and is pending/processing
-            existing_job = db.query(IngestJob).filter(
-                IngestJob.youtube_id == youtube_id,
-                IngestJob.status.in_(['pending', 'processing'])
-            ).first()
-            if existing_job:
-                # Job already queued or being processed, skip
-                continue
-            
-            # Create new job (either new video or failed video that needs retry)
-            crud.create_ingest_job(db, youtube_id)
-            new_ids.append(youtube_id)
+        # Find which ones are new or failed: two set-valued lookups for the
+        # whole playlist instead of two queries per video.
+        candidates = list(dict.fromkeys(
+            youtube_id for youtube_id in playlist_ids
+            if youtube_id not in SKIP_VIDEO_IDS  # Skip known bad video IDs
+        ))
+        
+        # Videos already successfully processed
+        processed = crud.get_processed_youtube_ids(db, candidates)
+        # Jobs already queued or being processed
+        queued = crud.get_active_job_youtube_ids(db, candidates)
+        
+        # Create new jobs (either new videos or failed videos that need retry)
+        new_ids = crud.create_ingest_jobs_bulk(db, [
+            youtube_id for youtube_id in candidates
+            if youtube_id not in processed and youtube_id not in queued
+        ])
         
         db.commit()
         
@@ -130,15 +128,18 @@ def run_one_job(
     try:
         # Get and lock one pending job
         job = crud.get_pending_job(db)
-        db.commit()  # Commit the lock
         
         if not job:
+            db.commit()
             return IngestRunResponse(
                 processed=False,
                 message="No pending jobs in queue"
             )
         
+        # Read before committing: commit expires the object, and reading
+        # it afterwards would cost another SELECT.
         youtube_id: str = getattr(job, 'youtube_id', '')
+        db.commit()  # Commit the claim (status='processing'), releasing the row lock
         
         # Process the video
         result = process_video(
@@ -155,6 +156,9 @@ def run_one_job(
         
         db.commit()
         
+        if result.success:
+            invalidate_metadata_cache()
+        
         return IngestRunResponse(
             processed=True,
             youtube_id=result.youtube_id,
@@ -210,48 +214,91 @@ def _run_batch_jobs(
     skip_classification: bool = False,
 ) -> list[IngestRunResponse]:
     """Internal implementation for run-batch endpoint."""
-    results = []
+    try:
+        # Claim the whole batch in one statement and commit, releasing the
+        # row locks before the long-running processing.
+        claimed = crud.claim_pending_jobs(db, max_jobs)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        return [IngestRunResponse(
+            processed=False,
+            error=str(e),
+            message=f"Error: {str(e)}"
+        )]
     
-    for _ in range(max_jobs):
+    # One videos.list request for the whole batch; anything missing is
+    # fetched individually by process_video.
+    try:
+        metadata = get_videos_metadata([youtube_id for _, youtube_id, _ in claimed]) if claimed else {}
+    except Exception:
+        metadata = {}
+    
+    def run(youtube_id: str):
         try:
-            job = crud.get_pending_job(db)
-            db.commit()
-            
-            if not job:
-                break
-            
-            youtube_id: str = getattr(job, 'youtube_id', '')
-            
-            result = process_video(
+            return process_video(
                 youtube_id,
                 skip_classification=skip_classification,
                 verbose=False,
+                metadata=metadata.get(youtube_id),
             )
-            
-            if result.success:
-                crud.complete_ingest_job(db, job)
-            else:
-                crud.complete_ingest_job(db, job, error=result.error)
-            
-            db.commit()
-            
-            results.append(IngestRunResponse(
-                processed=True,
-                youtube_id=result.youtube_id,
-                title=result.title,
-                questions_saved=result.questions_saved,
-                error=result.error,
-                message="Success" if result.success else f"Failed: {result.error}"
-            ))
-            
         except Exception as e:
-            db.rollback()
+            return e
+    
+    # process_video opens its own sessions, so jobs can run in parallel
+    # threads; map() keeps results in claim order.
+    processed = []
+    if claimed:
+        with ThreadPoolExecutor(max_workers=min(len(claimed), BATCH_CONCURRENCY)) as pool:
+            processed = list(pool.map(run, [youtube_id for _, youtube_id, _ in claimed]))
+    
+    results = []
+    outcomes = []
+    
+    for (job_id, youtube_id, attempts), result in zip(claimed, processed):
+        if isinstance(result, Exception):
+            outcomes.append((job_id, attempts, str(result)))
             results.append(IngestRunResponse(
                 processed=False,
-                error=str(e),
-                message=f"Error: {str(e)}"
+                youtube_id=youtube_id,
+                error=str(result),
+                message=f"Error: {str(result)}"
             ))
-            break
+            continue
+        
+        outcomes.append((job_id, attempts, None if result.success else result.error))
+        results.append(IngestRunResponse(
+            processed=True,
+            youtube_id=result.youtube_id,
+            title=result.title,
+            questions_saved=result.questions_saved,
+            error=result.error,
+            message="Success" if result.success else f"Failed: {result.error}"
+        ))
+    
+    if any(error is None for _, _, error in outcomes):
+        invalidate_metadata_cache()
+    
+    # One UPDATE and one commit for the whole batch. If that fails, retry
+    # job by job so one bad row can't leave every claimed job stuck in
+    # 'processing' (nothing reclaims stale locks, and the active-job index
+    # would block re-enqueueing those videos).
+    try:
+        crud.complete_ingest_jobs(db, outcomes)
+        db.commit()
+    except Exception:
+        db.rollback()
+        for outcome in outcomes:
+            try:
+                crud.complete_ingest_jobs(db, [outcome])
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                results.append(IngestRunResponse(
+                    processed=False,
+                    error=str(e),
+                    message=f"Error: {str(e)}"
+                ))
     
     return results
 
@@ -263,18 +310,7 @@ def get_queue_status(db: Session = Depends(get_db)):
     
     Requires X-API-Key header.
     """
-    pending = db.query(IngestJob).filter(IngestJob.status == "pending").count()
-    processing = db.query(IngestJob).filter(IngestJob.status == "processing").count()
-    done = db.query(IngestJob).filter(IngestJob.status == "done").count()
-    failed = db.query(IngestJob).filter(IngestJob.status == "failed").count()
-    
-    return IngestQueueStats(
-        pending=pending,
-        processing=processing,
-        done=done,
-        failed=failed,
-        total=pending + processing + done + failed,
-    )
+    return IngestQueueStats(**crud.count_jobs_by_status(db))
 
 
 @router.post("/reprocess/{youtube_id}", response_model=IngestRunResponse)
@@ -291,8 +327,7 @@ def reprocess_video(
     Requires X-API-Key header.
     """
     # Check if video exists
-    video = crud.get_video_by_youtube_id(db, youtube_id)
-    if not video:
+    if not crud.video_exists(db, youtube_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Video not found: {youtube_id}"
@@ -307,6 +342,9 @@ def reprocess_video(
         
         db.commit()
         
+        if result.success:
+            invalidate_metadata_cache()
+        
         return IngestRunResponse(
             processed=True,
             youtube_id=result.youtube_id,
@@ -2,9 +2,10 @@
 Public read-only API endpoints for the website.
 """
 
-from typing import Optional
+import time
+from typing import Callable, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, load_only, undefer
 from sqlalchemy import func, text, select
 
 from app.archive import search_archive
@@ -27,6 +28,19 @@ from app.schemas import (
 
 router = APIRouter(prefix="/v1", tags=["public"])
 
+# List views return the stored answer_preview, never the full answer, so
+# they skip loading `answer` (and the search vector) for every row.
+_QA_LIST_COLUMNS = load_only(
+    QAItem.id,
+    QAItem.timestamp_text,
+    QAItem.timestamp_seconds,
+    QAItem.question,
+    QAItem.answer_preview,
+    QAItem.category,
+    QAItem.subcategory,
+    QAItem.passages,
+)
+
 
 @router.post("/ask", response_model=AskResponse)
 async def ask_archive(
@@ -134,28 +148,25 @@ def list_videos_summary(
     Returns categories, subcategories, and tags for each video.
     Useful for frontend filtering/faceting.
     """
-    # Raw SQL for complex aggregation
-    sql = text("""
-        SELECT 
-            v.youtube_id,
-            v.title,
-            v.channel_title,
-            v.published_at,
-            COUNT(q.id) AS qa_count,
-            ARRAY_AGG(DISTINCT q.category) FILTER (WHERE q.category IS NOT NULL) AS categories,
-            ARRAY_AGG(DISTINCT q.subcategory) FILTER (WHERE q.subcategory IS NOT NULL) AS subcategories,
-            ARRAY_AGG(DISTINCT t.name) FILTER (WHERE t.name IS NOT NULL) AS tags
-        FROM videos v
-        LEFT JOIN qa_items q ON q.video_id = v.id
-        LEFT JOIN qa_item_tags qt ON qt.qa_item_id = q.id
-        LEFT JOIN tags t ON t.id = qt.tag_id
-        WHERE v.status = 'processed'
-        GROUP BY v.id
-        ORDER BY v.published_at DESC
-        LIMIT :limit OFFSET :offset
-    """)
-    
-    result = db.execute(sql, {"limit": limit, "offset": offset})
+    # The aggregates are precomputed on the videos row whenever its Q&A
+    # items are written (crud.refresh_video_summaries), so this is a
+    # plain page of videos.
+    result = db.execute(
+        select(
+            Video.youtube_id,
+            Video.title,
+            Video.channel_title,
+            Video.published_at,
+            Video.qa_count,
+            Video.categories,
+            Video.subcategories,
+            Video.tags,
+        )
+        .where(Video.status == "processed")
+        .order_by(Video.published_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
     
     summaries = []
     for row in result:
@@ -181,7 +192,9 @@ def get_video(
     """
     Get a single video by YouTube ID.
     """
-    video = db.query(Video).filter(Video.youtube_id == youtube_id).first()
+    video = db.query(Video).options(
+        undefer(Video.description),
+    ).filter(Video.youtube_id == youtube_id).first()
     
     if not video:
         raise HTTPException(
@@ -211,15 +224,15 @@ def get_video_questions(
     - **tags**: Comma-separated list of tags (AND logic - must have ALL tags)
     - **q**: Keyword search using full-text search
     """
-    # Get video first
-    video = db.query(Video).filter(Video.youtube_id == youtube_id).first()
-    if not video:
+    # Get the video's ID first (only the ID: no Video row is built)
+    video_id = db.scalar(select(Video.id).where(Video.youtube_id == youtube_id))
+    if video_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Video not found: {youtube_id}"
         )
     
-    query = db.query(QAItem).filter(QAItem.video_id == video.id)
+    query = db.query(QAItem).options(_QA_LIST_COLUMNS).filter(QAItem.video_id == video_id)
     
     # Apply filters
     if category:
@@ -249,24 +262,8 @@ def get_video_questions(
         )
     
     query = query.order_by(QAItem.timestamp_seconds)
-    qa_items = query.offset(offset).limit(limit).all()
-    
-    # Convert to response model with tags
-    results = []
-    for item in qa_items:
-        results.append(QAItemOut(
-            id=str(getattr(item, 'id')),
-            timestamp_text=getattr(item, 'timestamp_text'),
-            timestamp_seconds=getattr(item, 'timestamp_seconds'),
-            question=getattr(item, 'question'),
-            answer_preview=getattr(item, 'answer_preview'),
-            category=getattr(item, 'category'),
-            subcategory=getattr(item, 'subcategory'),
-            tags=[getattr(t, 'name') for t in item.tags],
-            passages=getattr(item, 'passages') or [],
-        ))
-
-    return results
+    # QAItemOut validates the ORM rows directly (tags are selectin-loaded).
+    return query.offset(offset).limit(limit).all()
 
 
 # --- Q&A / Browse & Search Endpoints ---
@@ -302,7 +299,12 @@ def list_questions(
     - `/v1/questions?passage=Romans 9`
     """
     # Only get questions from processed videos
-    query = db.query(QAItem).join(Video).filter(Video.status == "processed")
+    query = (
+        db.query(QAItem)
+        .options(_QA_LIST_COLUMNS)
+        .join(Video)
+        .filter(Video.status == "processed")
+    )
     
     # Apply category filter
     if category:
@@ -334,24 +336,8 @@ def list_questions(
 
     # Order by most recent video first, then by timestamp
     query = query.order_by(Video.published_at.desc(), QAItem.timestamp_seconds)
-    qa_items = query.offset(offset).limit(limit).all()
-
-    # Convert to response model
-    results = []
-    for item in qa_items:
-        results.append(QAItemOut(
-            id=str(getattr(item, 'id')),
-            timestamp_text=getattr(item, 'timestamp_text'),
-            timestamp_seconds=getattr(item, 'timestamp_seconds'),
-            question=getattr(item, 'question'),
-            answer_preview=getattr(item, 'answer_preview'),
-            category=getattr(item, 'category'),
-            subcategory=getattr(item, 'subcategory'),
-            tags=[getattr(t, 'name') for t in item.tags],
-            passages=getattr(item, 'passages') or [],
-        ))
-
-    return results
+    # QAItemOut validates the ORM rows directly (tags are selectin-loaded).
+    return query.offset(offset).limit(limit).all()
 
 
 @router.get("/questions/search", response_model=SearchResponse)
@@ -362,6 +348,7 @@ def search_questions(
     tags: Optional[str] = Query(default=None, description="Comma-separated tags (AND logic)"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    exact_count: bool = Query(default=True, description="Include the total match count"),
     db: Session = Depends(get_db),
 ):
     """
@@ -371,14 +358,20 @@ def search_questions(
     - **category**: Filter by category
     - **subcategory**: Filter by subcategory  
     - **tags**: Comma-separated list of tags (AND logic - must have ALL tags)
+    - **exact_count**: If false, `total` is omitted (null) and only
+      `has_more` tells whether another page exists, which spares counting
+      every match
     
     Examples:
     - `/v1/questions/search?q=baptism`
     - `/v1/questions/search?q=salvation&category=Theology`
     - `/v1/questions/search?q=grace&tags=Calvinism,Election`
+    - `/v1/questions/search?q=grace&exact_count=false`
     """
+    total_select = ",\n            COUNT(*) OVER () as total_count" if exact_count else ""
+    
     # Build the search query using raw SQL for ranking
-    base_sql = """
+    base_sql = f"""
         SELECT
             q.id,
             q.timestamp_text,
@@ -392,6 +385,7 @@ def search_questions(
             v.title as video_title,
             ts_rank(q.search_tsv, plainto_tsquery('english', :query)) as rank,
             ARRAY_AGG(DISTINCT t.name) FILTER (WHERE t.name IS NOT NULL) as tags
+            {total_select}
         FROM qa_items q
         JOIN videos v ON v.id = q.video_id
         LEFT JOIN qa_item_tags qt ON qt.qa_item_id = q.id
@@ -400,7 +394,8 @@ def search_questions(
           AND q.search_tsv @@ plainto_tsquery('english', :query)
     """
     
-    params = {"query": q, "limit": limit, "offset": offset}
+    # One extra row tells whether there is a next page.
+    params = {"query": q, "limit": limit + 1, "offset": offset}
     
     # Add filters
     if category:
@@ -425,34 +420,22 @@ def search_questions(
         LIMIT :limit OFFSET :offset
     """
     
-    result = db.execute(text(base_sql), params)
-    
-    # Count total results
-    count_sql = """
-        SELECT COUNT(DISTINCT q.id)
-        FROM qa_items q
-        JOIN videos v ON v.id = q.video_id
-        WHERE v.status = 'processed'
-          AND q.search_tsv @@ plainto_tsquery('english', :query)
-    """
-    count_params = {"query": q}
-    
-    if category:
-        count_sql += " AND q.category = :category"
-        count_params["category"] = category
-    if subcategory:
-        count_sql += " AND q.subcategory = :subcategory"
-        count_params["subcategory"] = subcategory
-    
-    # Multi-tag filter for count query
-    if tags:
-        tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-        for i, tag_name in enumerate(tag_list):
-            param_name = f"tag_{i}"
-            count_sql += f" AND EXISTS (SELECT 1 FROM qa_item_tags qt{i} JOIN tags t{i} ON t{i}.id = qt{i}.tag_id WHERE qt{i}.qa_item_id = q.id AND t{i}.name = :{param_name})"
-            count_params[param_name] = tag_name
-    
-    total = db.execute(text(count_sql), count_params).scalar() or 0
+    result = db.execute(text(base_sql), params).all()
+    has_more = len(result) > limit
+    result = result[:limit]
+    
+    # total_count is a window over the grouped rows, so the full-text match
+    # is evaluated once for both the page and the total.
+    total = None
+    if exact_count:
+        if result:
+            total = result[0].total_count
+        elif offset > 0:
+            # Past the last page: fetch one row of the same query for the total.
+            first = db.execute(text(base_sql), {**params, "limit": 1, "offset": 0}).first()
+            total = first.total_count if first else 0
+        else:
+            total = 0
     
     # Build results
     results = []
@@ -475,6 +458,7 @@ def search_questions(
     return SearchResponse(
         query=q,
         total=total,
+        has_more=has_more,
         results=results,
     )
 
@@ -487,7 +471,10 @@ def get_question(
     """
     Get a single Q&A item by ID with full answer.
     """
-    qa_item = db.query(QAItem).filter(QAItem.id == question_id).first()
+    # The video comes back in the same SELECT (tags via their selectin load).
+    qa_item = db.query(QAItem).options(
+        joinedload(QAItem.video, innerjoin=True),
+    ).filter(QAItem.id == question_id).first()
     
     if not qa_item:
         raise HTTPException(
@@ -495,8 +482,7 @@ def get_question(
             detail=f"Question not found: {question_id}"
         )
     
-    # Get video info
-    video = db.query(Video).filter(Video.id == qa_item.video_id).first()
+    video = qa_item.video
     
     return QAItemDetailOut(
         id=str(getattr(qa_item, 'id')),
@@ -516,16 +502,45 @@ def get_question(
 
 # --- Metadata Endpoints ---
 
+# Category/subcategory/tag lists only change when videos are ingested, so
+# each instance serves them from memory for a few minutes.
+METADATA_CACHE_TTL = 300  # seconds
+_METADATA_CACHE_MAX_ENTRIES = 256  # subcategories are keyed by user input
+
+_metadata_cache: dict[tuple, tuple[float, list[str]]] = {}
+
+
+def _cached_metadata(key: tuple, load: Callable[[], list[str]]) -> list[str]:
+    """Return the cached list for `key`, calling `load` when missing or stale."""
+    now = time.monotonic()
+    hit = _metadata_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+
+    value = load()
+    if len(_metadata_cache) >= _METADATA_CACHE_MAX_ENTRIES:
+        _metadata_cache.clear()
+    _metadata_cache[key] = (now + METADATA_CACHE_TTL, value)
+    return value
+
+
+def invalidate_metadata_cache() -> None:
+    """Drop this instance's cached metadata lists (call after ingesting)."""
+    _metadata_cache.clear()
+
+
 @router.get("/categories", response_model=list[str])
 def list_categories(db: Session = Depends(get_db)):
     """
     Get all unique categories.
     """
-    result = db.query(QAItem.category).filter(
-        QAItem.category.isnot(None)
-    ).distinct().all()
+    def load() -> list[str]:
+        result = db.query(QAItem.category).filter(
+            QAItem.category.isnot(None)
+        ).distinct().all()
+        return sorted([r[0] for r in result])
     
-    return sorted([r[0] for r in result])
+    return _cached_metadata(("categories",), load)
 
 
 @router.get("/subcategories", response_model=list[str])
@@ -536,14 +551,16 @@ def list_subcategories(
     """
     Get all unique subcategories, optionally filtered by category.
     """
-    query = db.query(QAItem.subcategory).filter(QAItem.subcategory.isnot(None))
-    
-    if category:
-        query = query.filter(QAItem.category == category)
-    
-    result = query.distinct().all()
+    def load() -> list[str]:
+        query = db.query(QAItem.subcategory).filter(QAItem.subcategory.isnot(None))
+        
+        if category:
+            query = query.filter(QAItem.category == category)
+        
+        result = query.distinct().all()
+        return sorted([r[0] for r in result])
     
-    return sorted([r[0] for r in result])
+    return _cached_metadata(("subcategories", category), load)
 
 
 @router.get("/tags", response_model=list[str])
@@ -554,15 +571,17 @@ def list_tags(
     """
     Get all tags, ordered by usage count.
     """
-    result = db.query(
-        Tag.name,
-        func.count(QAItemTag.qa_item_id).label("count")
-    ).join(
-        QAItemTag, Tag.id == QAItemTag.tag_id
-    ).group_by(
-        Tag.id
-    ).order_by(
-        func.count(QAItemTag.qa_item_id).desc()
-    ).limit(limit).all()
-    
-    return [r[0] for r in result]
+    def load() -> list[str]:
+        result = db.query(
+            Tag.name,
+            func.count(QAItemTag.qa_item_id).label("count")
+        ).join(
+            QAItemTag, Tag.id == QAItemTag.tag_id
+        ).group_by(
+            Tag.id
+        ).order_by(
+            func.count(QAItemTag.qa_item_id).desc()
+        ).limit(limit).all()
+        return [r[0] for r in result]
+    
+    return _cached_metadata(("tags", limit), load)
@@ -4,7 +4,7 @@ Pydantic schemas for API request/response models.
 
 from datetime import datetime
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # --- Video Schemas ---
@@ -56,7 +56,12 @@ class QAItemBase(BaseModel):
 
 
 class QAItemOut(QAItemBase):
-    """Q&A response for list views (with preview)."""
+    """
+    Q&A response for list views (with preview).
+
+    Validates straight from a QAItem ORM object: endpoints return the rows
+    and the validators below map the UUID, Tag objects and NULL passages.
+    """
     id: str
     answer_preview: Optional[str] = None
     tags: list[str] = Field(default_factory=list)
@@ -65,6 +70,21 @@ class QAItemOut(QAItemBase):
     class Config:
         from_attributes = True
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def _id_to_str(cls, value):
+        return str(value)
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def _tag_names(cls, value):
+        return [getattr(tag, "name", tag) for tag in value or ()]
+
+    @field_validator("passages", mode="before")
+    @classmethod
+    def _passages_or_empty(cls, value):
+        return value or []
+
 
 class QAItemDetailOut(QAItemBase):
     """Q&A response with full answer."""
@@ -101,7 +121,8 @@ class SearchResult(BaseModel):
 class SearchResponse(BaseModel):
     """Search endpoint response."""
     query: str
-    total: int
+    total: Optional[int] = None  # None when exact_count=false
+    has_more: bool = False
     results: list[SearchResult]
 
 
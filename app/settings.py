@@ -15,6 +15,14 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+
+    # Connection pool sizing. When DATABASE_URL points at Neon's pooled
+    # (-pooler / PgBouncer) endpoint, set DB_POOL_SIZE=5 and
+    # DB_MAX_OVERFLOW=0 to avoid pooling twice.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a connection
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a connection is replaced
     
     # YouTube Data API key for fetching video metadata.
     # (Transcripts are fetched via youtube_transcript_api and do not need this key.)
@@ -22,6 +30,18 @@ class Settings:
     
     # Gemini API for classification
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    # Client-side Gemini budget for classification (0 disables a limit).
+    # Defaults match paid Tier 1; lower them for the free tier.
+    GEMINI_RPM: int = int(os.getenv("GEMINI_RPM", "300"))
+    GEMINI_TPM: int = int(os.getenv("GEMINI_TPM", "1000000"))
+    # Q&A items classified per Gemini request (1 = one request per item).
+    # Larger values send the categories prompt once for several items.
+    ROW_MARSHAL_BATCH_SIZE: int = int(os.getenv("ROW_MARSHAL_BATCH_SIZE", "1"))
+    # Directory for the on-disk classification cache (unset = disabled).
+    CLASSIFY_CACHE_DIR: str = os.getenv("CLASSIFY_CACHE_DIR", "")
+    # Answers shorter than this are labelled without calling Gemini
+    # (0 = always call).
+    MIN_ANSWER_CHARS_FOR_LLM: int = int(os.getenv("MIN_ANSWER_CHARS_FOR_LLM", "20"))
     
     # Playlist configuration
     PLAYLIST_ID: str = os.getenv("PLAYLIST_ID", "PLczriqVOY-tll3hzb2O7jHwKaEV1kd2IJ")
@@ -53,7 +73,7 @@ class Settings:
         return missing
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -0,0 +1,125 @@
+"""
+Optional on-disk cache for YouTube lookups, keyed by video (or playlist) ID.
+
+Re-running a backfill or manual ingest otherwise re-downloads the same
+metadata, transcripts and playlist listings, which dominates wall time
+and burns API quota.
+The cache is off until a CLI calls configure_cache(), so the API (which
+runs on a read-only serverless filesystem) never touches it.
+"""
+
+import threading
+from functools import wraps
+from typing import Any, Callable, Optional
+
+DEFAULT_CACHE_DIR = ".cache/youtube"
+
+METADATA_TTL = 24 * 60 * 60  # 24 hours
+TRANSCRIPT_TTL = 7 * 24 * 60 * 60  # 7 days
+PLAYLIST_TTL = 60 * 60  # 1 hour: new uploads should show up the same day
+
+_cache = None
+_refresh = False
+_hits = 0
+_misses = 0
+_stats_lock = threading.Lock()
+_MISSING = object()
+
+
+def configure_cache(directory: Optional[str] = DEFAULT_CACHE_DIR, refresh: bool = False) -> None:
+    """
+    Enable (or disable) the disk cache for this process.
+
+    Args:
+        directory: Cache directory, or None to disable caching
+        refresh: If True, ignore cached values but store fresh results
+    """
+    global _cache, _refresh
+
+    if directory is None:
+        _cache = None
+        return
+
+    # Imported lazily: only the CLI needs diskcache installed.
+    from diskcache import Cache
+
+    _cache = Cache(directory)
+    _refresh = refresh
+
+
+def is_enabled() -> bool:
+    """True if a CLI has turned the cache on for this process."""
+    return _cache is not None
+
+
+def get_cache_stats() -> tuple[int, int]:
+    """Return (hits, misses) since the process started."""
+    with _stats_lock:
+        return _hits, _misses
+
+
+def _record(hit: bool) -> None:
+    global _hits, _misses
+    with _stats_lock:
+        if hit:
+            _hits += 1
+        else:
+            _misses += 1
+
+
+def lookup(namespace: str, video_id: str) -> Any:
+    """
+    Return the cached value for `video_id`, or None on a miss.
+
+    Also None when caching is off or refresh is set. Counts towards the
+    hit/miss stats.
+    """
+    cache = _cache
+    if cache is None:
+        return None
+
+    if not _refresh:
+        value = cache.get(f"{namespace}:{video_id}", default=_MISSING)
+        if value is not _MISSING:
+            _record(hit=True)
+            return value
+
+    _record(hit=False)
+    return None
+
+
+def store(namespace: str, video_id: str, value: Any, expire: int) -> None:
+    """Cache a non-None value for `video_id` (no-op when caching is off)."""
+    cache = _cache
+    if cache is not None and value is not None:
+        cache.set(f"{namespace}:{video_id}", value, expire=expire)
+
+
+def cached_by_video_id(namespace: str, expire: int) -> Callable:
+    """
+    Decorate a `fetch(video_id)` function with the disk cache.
+
+    None results (API errors, missing videos) are never cached so they are
+    retried on the next run.
+
+    Args:
+        namespace: Key prefix separating different kinds of lookups
+        expire: Time-to-live in seconds
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        @wraps(func)
+        def wrapper(video_id: str) -> Any:
+            if _cache is None:
+                return func(video_id)
+
+            value = lookup(namespace, video_id)
+            if value is not None:
+                return value
+
+            value = func(video_id)
+            store(namespace, video_id, value, expire)
+            return value
+
+        return wrapper
+
+    return decorator
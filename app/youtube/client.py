@@ -0,0 +1,33 @@
+"""
+Shared YouTube Data API client.
+"""
+
+import threading
+
+from googleapiclient.discovery import build
+
+from app.settings import get_settings
+
+_local = threading.local()
+
+
+def get_youtube_client():
+    """
+    Return this thread's YouTube Data API v3 client, built on first use.
+
+    build() parses the discovery document and sets up a new HTTP client,
+    which costs more than a typical videos.list call, so it is done once
+    per thread rather than per request. Clients are per thread because
+    the underlying httplib2 connection is not thread-safe, and the
+    pipeline runs from several threads (backfill, run-batch).
+    """
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = build(
+            'youtube',
+            'v3',
+            developerKey=get_settings().YOUTUBE_API_KEY,
+            cache_discovery=False,  # Bundled static discovery doc; no file cache
+        )
+        _local.client = client
+    return client
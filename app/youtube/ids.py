@@ -5,6 +5,10 @@ YouTube video ID extraction from various URL formats.
 import re
 from typing import Optional
 
+# v=, /live/, /shorts/, or youtu.be/ followed by an 11-char ID
+_URL_RE = re.compile(r"(?:v=|/live/|/shorts/|youtu\.be/)([0-9A-Za-z_-]{11})")
+_ID_RE = re.compile(r"^[0-9A-Za-z_-]{11}$")
+
 
 def get_video_id(url: str) -> str:
     """
@@ -25,15 +29,13 @@ def get_video_id(url: str) -> str:
     Raises:
         ValueError: If video ID cannot be extracted
     """
-    # Pattern matches v=, /live/, /shorts/, or youtu.be/ followed by 11-char ID
-    regex = r"(?:v=|\/live\/|\/shorts\/|\/youtu\.be\/|youtu\.be\/)([0-9A-Za-z_-]{11})"
-    match = re.search(regex, url)
+    match = _URL_RE.search(url)
     
     if match:
         return match.group(1)
     
     # Check if it's already just a video ID
-    if re.match(r"^[0-9A-Za-z_-]{11}$", url):
+    if _ID_RE.match(url):
         return url
     
     raise ValueError(f"Could not extract video ID from: {url}")
@@ -62,4 +64,4 @@ def is_valid_video_id(video_id: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    return bool(re.match(r"^[0-9A-Za-z_-]{11}$", video_id))
+    return bool(_ID_RE.match(video_id))
@@ -2,12 +2,17 @@
 Fetch video metadata from YouTube Data API v3.
 """
 
+import logging
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass
-from googleapiclient.discovery import build
 
 from app.settings import get_settings
+from app.youtube import cache
+from app.youtube.cache import cached_by_video_id, METADATA_TTL
+from app.youtube.client import get_youtube_client
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -21,6 +26,35 @@ class VideoMetadata:
     published_at: Optional[datetime]
     
 
+# videos.list accepts at most this many comma-separated IDs per request.
+MAX_IDS_PER_REQUEST = 50
+
+
+def _metadata_from_item(item: dict) -> VideoMetadata:
+    """Build VideoMetadata from one videos.list result item."""
+    snippet = item['snippet']
+    
+    # Parse published_at datetime
+    published_at = None
+    if 'publishedAt' in snippet:
+        try:
+            # ISO 8601 format: 2025-01-15T14:30:00Z (Python 3.11+ parses
+            # the Z suffix as UTC)
+            published_at = datetime.fromisoformat(snippet['publishedAt'])
+        except (ValueError, TypeError):
+            pass
+    
+    return VideoMetadata(
+        video_id=item['id'],
+        title=snippet.get('title', ''),
+        description=snippet.get('description', ''),
+        channel_id=snippet.get('channelId', ''),
+        channel_title=snippet.get('channelTitle', ''),
+        published_at=published_at,
+    )
+
+
+@cached_by_video_id("metadata", expire=METADATA_TTL)
 def get_video_metadata(video_id: str) -> Optional[VideoMetadata]:
     """
     Fetches video metadata using YouTube Data API v3.
@@ -38,7 +72,7 @@ def get_video_metadata(video_id: str) -> Optional[VideoMetadata]:
         raise ValueError("YOUTUBE_API_KEY not configured")
 
     try:
-        youtube = build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY)
+        youtube = get_youtube_client()
         
         request = youtube.videos().list(
             part="snippet",
@@ -47,36 +81,64 @@ def get_video_metadata(video_id: str) -> Optional[VideoMetadata]:
         response = request.execute()
         
         if not response.get('items'):
-            print(f"Video not found: {video_id}")
+            logger.warning("Video not found: %s", video_id)
             return None
         
-        snippet = response['items'][0]['snippet']
-        
-        # Parse published_at datetime
-        published_at = None
-        if 'publishedAt' in snippet:
-            try:
-                # ISO 8601 format: 2025-01-15T14:30:00Z
-                published_at = datetime.fromisoformat(
-                    snippet['publishedAt'].replace('Z', '+00:00')
-                )
-            except (ValueError, TypeError):
-                pass
-        
-        return VideoMetadata(
-            video_id=video_id,
-            title=snippet.get('title', ''),
-            description=snippet.get('description', ''),
-            channel_id=snippet.get('channelId', ''),
-            channel_title=snippet.get('channelTitle', ''),
-            published_at=published_at,
-        )
+        return _metadata_from_item(response['items'][0])
         
     except Exception as e:
-        print(f"YouTube API Error for {video_id}: {e}")
+        logger.warning("YouTube API error for %s: %s", video_id, e)
         return None
 
 
+def get_videos_metadata(video_ids: list[str]) -> dict[str, VideoMetadata]:
+    """
+    Fetch metadata for many videos, up to 50 per API request.
+
+    Uses and fills the same cache as get_video_metadata.
+    
+    Args:
+        video_ids: YouTube video IDs
+        
+    Returns:
+        Dict of video ID to VideoMetadata. Videos that weren't found, or
+        whose request failed, are left out; callers can fall back to
+        get_video_metadata for those.
+    """
+    settings = get_settings()
+    
+    if not settings.YOUTUBE_API_KEY:
+        raise ValueError("YOUTUBE_API_KEY not configured")
+    
+    results: dict[str, VideoMetadata] = {}
+    missing = []
+    for video_id in dict.fromkeys(video_ids):
+        cached = cache.lookup("metadata", video_id)
+        if cached is not None:
+            results[video_id] = cached
+        else:
+            missing.append(video_id)
+    
+    for i in range(0, len(missing), MAX_IDS_PER_REQUEST):
+        chunk = missing[i:i + MAX_IDS_PER_REQUEST]
+        try:
+            response = get_youtube_client().videos().list(
+                part="snippet",
+                id=",".join(chunk),
+                maxResults=MAX_IDS_PER_REQUEST,
+            ).execute()
+        except Exception as e:
+            logger.warning("YouTube API error for %d videos: %s", len(chunk), e)
+            continue
+        
+        for item in response.get('items', []):
+            metadata = _metadata_from_item(item)
+            results[metadata.video_id] = metadata
+            cache.store("metadata", metadata.video_id, metadata, METADATA_TTL)
+    
+    return results
+
+
 def get_video_description(video_id: str) -> Optional[str]:
     """
     Convenience function to get just the description.
@@ -2,10 +2,14 @@
 Playlist operations for fetching videos from YouTube playlists/channels.
 """
 
-from typing import Optional
-from googleapiclient.discovery import build
+import logging
+from typing import Container, Iterator, Optional
 
 from app.settings import get_settings
+from app.youtube.cache import cached_by_video_id, PLAYLIST_TTL
+from app.youtube.client import get_youtube_client
+
+logger = logging.getLogger(__name__)
 
 
 def get_playlist_video_ids(playlist_id: Optional[str] = None) -> list[str]:
@@ -23,52 +27,94 @@ def get_playlist_video_ids(playlist_id: Optional[str] = None) -> list[str]:
     if not settings.YOUTUBE_API_KEY:
         raise ValueError("YOUTUBE_API_KEY not configured")
 
-    playlist_id = playlist_id or settings.PLAYLIST_ID
+    return _fetch_playlist_video_ids(playlist_id or settings.PLAYLIST_ID) or []
+
+
+def _iter_playlist_pages(playlist_id: str) -> Iterator[list[str]]:
+    """Yield the video IDs of a playlist one page (up to 50) at a time."""
+    youtube = get_youtube_client()
+    next_page_token = None
+
+    # Page tokens are opaque and only come back with the previous
+    # page, so pages can't be fetched in parallel; instead each page
+    # asks only for the fields read below, which keeps the responses
+    # (and their parsing) small.
+    while True:
+        request = youtube.playlistItems().list(
+            part='contentDetails',
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=next_page_token,
+            fields='nextPageToken,items/contentDetails/videoId',
+        )
+        response = request.execute()
+
+        yield [item['contentDetails']['videoId'] for item in response.get('items', [])]
+
+        next_page_token = response.get('nextPageToken')
+        if not next_page_token:
+            break
+
 
+@cached_by_video_id("playlist", expire=PLAYLIST_TTL)
+def _fetch_playlist_video_ids(playlist_id: str) -> Optional[list[str]]:
+    """Page through a playlist; None on API errors (so they aren't cached)."""
     try:
-        youtube = build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY)
-        
         video_ids = []
-        next_page_token = None
-        
-        while True:
-            request = youtube.playlistItems().list(
-                part='contentDetails',
-                playlistId=playlist_id,
-                maxResults=50,
-                pageToken=next_page_token
-            )
-            response = request.execute()
-            
-            for item in response.get('items', []):
-                video_id = item['contentDetails']['videoId']
-                video_ids.append(video_id)
-            
-            next_page_token = response.get('nextPageToken')
-            if not next_page_token:
-                break
-        
+        for page in _iter_playlist_pages(playlist_id):
+            video_ids.extend(page)
         return video_ids
         
     except Exception as e:
-        print(f"Playlist API Error: {e}")
-        return []
+        logger.warning("Playlist API error: %s", e)
+        return None
 
 
 def get_new_videos_in_playlist(
     playlist_id: Optional[str] = None,
-    known_ids: Optional[set[str]] = None,
+    known_ids: Optional[Container[str]] = None,
+    max_pages: Optional[int] = None,
+    stop_at_known_page: bool = False,
 ) -> list[str]:
     """
     Get video IDs from playlist that are not in the known set.
     
+    Pages through the whole playlist by default. Curated playlists (like
+    the default PLAYLIST_ID) usually add new videos at the end, so no
+    page can be assumed to be the last with anything new on it.
+    
     Args:
         playlist_id: YouTube playlist ID. If None, uses PLAYLIST_ID from settings.
-        known_ids: Set of already-known video IDs to exclude
+        known_ids: Already-known video IDs to exclude. Anything supporting
+            `in` works, e.g. a set or a probabilistic filter (whose false
+            positives would hide a new video until the next full check)
+        max_pages: Stop after this many pages (50 videos each) regardless
+        stop_at_known_page: Stop at the first page whose videos are all
+            known. Only safe for newest-first playlists such as a channel's
+            uploads playlist (UU...), where it usually saves every request
+            after the first
         
     Returns:
         List of new video IDs not in known_ids
     """
+    settings = get_settings()
+
+    if not settings.YOUTUBE_API_KEY:
+        raise ValueError("YOUTUBE_API_KEY not configured")
+
     known_ids = known_ids or set()
-    all_ids = get_playlist_video_ids(playlist_id)
-    return [vid for vid in all_ids if vid not in known_ids]
+    new_ids = []
+
+    try:
+        for pages, page in enumerate(_iter_playlist_pages(playlist_id or settings.PLAYLIST_ID), 1):
+            page_new = [vid for vid in page if vid not in known_ids]
+            new_ids.extend(page_new)
+            if stop_at_known_page and page and not page_new:
+                break
+            if max_pages is not None and pages >= max_pages:
+                break
+    except Exception as e:
+        logger.warning("Playlist API error: %s", e)
+        return []
+
+    return new_ids
@@ -2,6 +2,8 @@
 Fetch transcripts from YouTube videos.
 """
 
+import logging
+import threading
 from typing import Optional
 from dataclasses import dataclass
 from http.cookiejar import MozillaCookieJar
@@ -10,11 +12,17 @@ from requests import Session
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import GenericProxyConfig
 from app.settings import get_settings
+from app.db.codec import compress_json, decompress_json
+from app.youtube import cache as youtube_cache
+from app.youtube.cache import TRANSCRIPT_TTL
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptSegment:
-    """A single segment of transcript with timing."""
+    """A single segment of transcript with timing (slotted: hour-long
+    videos have thousands of these)."""
     start: float  # Start time in seconds
     duration: float
     text: str
@@ -35,8 +43,57 @@ def _normalize_proxy_url(proxy_url: str) -> str:
     return proxy_url
 
 
-def _fetch_english_transcript(video_id: str, client_kwargs: dict):
-    yt = YouTubeTranscriptApi(**client_kwargs)
+_local = threading.local()
+
+
+def _build_client_kwargs(settings) -> dict:
+    """YouTubeTranscriptApi arguments for the configured proxy and cookies."""
+    client_kwargs = {}
+
+    if settings.YOUTUBE_PROXY:
+        proxy_url = _normalize_proxy_url(settings.YOUTUBE_PROXY)
+        client_kwargs["proxy_config"] = GenericProxyConfig(
+            http_url=proxy_url,
+            https_url=proxy_url,
+        )
+
+    http_client = None
+    needs_http_client = bool(settings.YOUTUBE_COOKIES or settings.YOUTUBE_PROXY)
+    if needs_http_client:
+        http_client = Session()
+
+        if not settings.YOUTUBE_PROXY_VERIFY_SSL:
+            http_client.verify = False
+
+    if settings.YOUTUBE_COOKIES and http_client is not None:
+        cookie_jar = MozillaCookieJar(settings.YOUTUBE_COOKIES)
+        cookie_jar.load(ignore_discard=True, ignore_expires=True)
+        for cookie in cookie_jar:
+            http_client.cookies.set_cookie(cookie)
+
+    if http_client is not None:
+        client_kwargs["http_client"] = http_client
+
+    return client_kwargs
+
+
+def _get_transcript_api() -> YouTubeTranscriptApi:
+    """
+    Return this thread's transcript client, built on first use.
+
+    The client owns a requests Session, so reusing it keeps connections
+    to YouTube (or the proxy) alive across videos instead of paying a new
+    TCP + TLS handshake and re-reading the cookie file for each one.
+    Per thread because requests Sessions aren't guaranteed thread-safe.
+    """
+    api = getattr(_local, "api", None)
+    if api is None:
+        api = YouTubeTranscriptApi(**_build_client_kwargs(get_settings()))
+        _local.api = api
+    return api
+
+
+def _fetch_english_transcript(video_id: str, yt: YouTubeTranscriptApi):
     transcript_list = yt.list(video_id)
 
     try:
@@ -47,11 +104,18 @@ def _fetch_english_transcript(video_id: str, client_kwargs: dict):
     return transcript.fetch()
 
 
+# Transcripts are cached as compressed JSON rather than pickled segment
+# lists: several times smaller on disk, and independent of the class layout
+# (older "transcript"/"transcript_v2" pickles are left to expire).
+_CACHE_NAMESPACE = "transcript_z"
+
+
 def get_raw_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
     """
     Fetches the transcript for a YouTube video.
     
     Tries to get manual English transcript first, falls back to auto-generated.
+    Served from the YouTube disk cache when a CLI has enabled it.
     
     Args:
         video_id: YouTube video ID (11 characters)
@@ -59,38 +123,31 @@ def get_raw_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
     Returns:
         List of TranscriptSegment objects, or None if unavailable
     """
+    if not youtube_cache.is_enabled():
+        return _download_transcript(video_id)
+
+    cached = youtube_cache.lookup(_CACHE_NAMESPACE, video_id)
+    if cached is not None:
+        return [TranscriptSegment(**seg) for seg in decompress_json(cached)]
+
+    segments = _download_transcript(video_id)
+    if segments is not None:
+        youtube_cache.store(
+            _CACHE_NAMESPACE,
+            video_id,
+            compress_json(transcript_to_raw_data(segments)),
+            TRANSCRIPT_TTL,
+        )
+    return segments
+
+
+def _download_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
+    """Fetch a transcript from YouTube (uncached); None if unavailable."""
     try:
         settings = get_settings()
-        
-        client_kwargs = {}
-        proxy_url = ""
-
-        if settings.YOUTUBE_PROXY:
-            proxy_url = _normalize_proxy_url(settings.YOUTUBE_PROXY)
-            client_kwargs["proxy_config"] = GenericProxyConfig(
-                http_url=proxy_url,
-                https_url=proxy_url,
-            )
-
-        http_client = None
-        needs_http_client = bool(settings.YOUTUBE_COOKIES or settings.YOUTUBE_PROXY)
-        if needs_http_client:
-            http_client = Session()
-
-            if not settings.YOUTUBE_PROXY_VERIFY_SSL:
-                http_client.verify = False
-
-        if settings.YOUTUBE_COOKIES and http_client is not None:
-            cookie_jar = MozillaCookieJar(settings.YOUTUBE_COOKIES)
-            cookie_jar.load(ignore_discard=True, ignore_expires=True)
-            for cookie in cookie_jar:
-                http_client.cookies.set_cookie(cookie)
-
-        if http_client is not None:
-            client_kwargs["http_client"] = http_client
 
         try:
-            fetched = _fetch_english_transcript(video_id, client_kwargs)
+            fetched = _fetch_english_transcript(video_id, _get_transcript_api())
         except Exception as fetch_error:
             error_text = str(fetch_error)
             cert_error = (
@@ -101,8 +158,9 @@ def get_raw_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
             proxy_ssl_enabled = settings.YOUTUBE_PROXY_VERIFY_SSL
 
             if cert_error and has_proxy and proxy_ssl_enabled:
-                print(
-                    "Transcript warning: SSL verify failed with proxy; retrying with SSL verification disabled"
+                logger.warning(
+                    "SSL verify failed with proxy for %s; retrying with SSL verification disabled",
+                    video_id,
                 )
                 fallback_http_client = Session()
                 fallback_http_client.verify = False
@@ -113,9 +171,12 @@ def get_raw_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
                     for cookie in cookie_jar:
                         fallback_http_client.cookies.set_cookie(cookie)
 
-                fallback_kwargs = dict(client_kwargs)
-                fallback_kwargs["http_client"] = fallback_http_client
-                fetched = _fetch_english_transcript(video_id, fallback_kwargs)
+                proxy_url = _normalize_proxy_url(settings.YOUTUBE_PROXY)
+                fallback_api = YouTubeTranscriptApi(
+                    proxy_config=GenericProxyConfig(http_url=proxy_url, https_url=proxy_url),
+                    http_client=fallback_http_client,
+                )
+                fetched = _fetch_english_transcript(video_id, fallback_api)
             else:
                 raise
         
@@ -130,7 +191,7 @@ def get_raw_transcript(video_id: str) -> Optional[list[TranscriptSegment]]:
         return segments
         
     except Exception as e:
-        print(f"Transcript Error for {video_id}: {e}")
+        logger.warning("Transcript error for %s: %s", video_id, e)
         return None
 
 
@@ -162,4 +223,5 @@ def transcript_to_full_text(segments: list[TranscriptSegment]) -> str:
     Returns:
         Full transcript as a single string
     """
-    return " ".join(seg.text for seg in segments)
+    # A list (not a generator) lets join size the result in one pass
+    return " ".join([seg.text for seg in segments])
@@ -0,0 +1,14 @@
+-- Migration 002: store transcript segments compressed
+--
+-- Adds a BYTEA column holding the zlib-compressed JSON segment list. New
+-- writes populate `raw_data_compressed` and leave `raw_data` NULL; reads
+-- fall back to the JSONB `raw_data` column for rows written before this
+-- migration. Idempotent: safe to re-run.
+--
+-- Apply against Neon before deploying the code that writes this column,
+-- otherwise transcript upserts will fail.
+--
+--   psql "$DATABASE_URL" -f migrations/002_add_transcript_raw_data_compressed.sql
+
+ALTER TABLE transcripts
+    ADD COLUMN IF NOT EXISTS raw_data_compressed BYTEA;
@@ -0,0 +1,28 @@
+-- Migration 003: at most one active ingest job per video
+--
+-- Adds a partial unique index on ingest_jobs(youtube_id) covering only
+-- pending/processing rows, so enqueueing can use INSERT ... ON CONFLICT DO
+-- NOTHING. Finished (done/failed) jobs are kept as history and may repeat.
+-- Idempotent: safe to re-run.
+--
+-- Existing duplicate active jobs are resolved first: the oldest one per
+-- video is kept and the rest are marked failed.
+--
+--   psql "$DATABASE_URL" -f migrations/003_unique_active_ingest_job.sql
+
+UPDATE ingest_jobs AS j
+SET status = 'failed',
+    last_error = 'Duplicate active job (superseded by migration 003)',
+    locked_at = NULL
+WHERE j.status IN ('pending', 'processing')
+  AND EXISTS (
+      SELECT 1
+      FROM ingest_jobs AS older
+      WHERE older.youtube_id = j.youtube_id
+        AND older.status IN ('pending', 'processing')
+        AND (older.created_at, older.id) < (j.created_at, j.id)
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_active_youtube_id
+    ON ingest_jobs (youtube_id)
+    WHERE status IN ('pending', 'processing');
@@ -0,0 +1,20 @@
+-- Migration 004: slimmer indexes for job polling and Q&A lookups
+--
+-- Rebuilds idx_jobs_status as a partial index over pending/processing rows
+-- only (the table is mostly done/failed history), keyed on
+-- (status, created_at) so the oldest-pending-job poll is a single index
+-- range scan.
+--
+-- Drops idx_qa_video_id: the uq_video_timestamp unique constraint index on
+-- (video_id, timestamp_seconds) already serves video_id lookups.
+-- Idempotent: safe to re-run.
+--
+--   psql "$DATABASE_URL" -f migrations/004_partial_job_status_index.sql
+
+DROP INDEX IF EXISTS idx_jobs_status;
+
+CREATE INDEX idx_jobs_status
+    ON ingest_jobs (status, created_at)
+    WHERE status IN ('pending', 'processing');
+
+DROP INDEX IF EXISTS idx_qa_video_id;
@@ -0,0 +1,13 @@
+-- Migration 005: trigram index for video title search
+--
+-- /v1/videos?q=... filters with title ILIKE '%q%'. A leading wildcard
+-- can't use a btree index, so every search scanned the whole table. A
+-- pg_trgm GIN index serves ILIKE '%...%' directly; the query is unchanged.
+-- pg_trgm is available on Neon. Idempotent: safe to re-run.
+--
+--   psql "$DATABASE_URL" -f migrations/005_video_title_trigram_index.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_videos_title_trgm
+    ON videos USING gin (title gin_trgm_ops);
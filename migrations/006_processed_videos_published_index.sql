@@ -0,0 +1,13 @@
+-- Migration 006: partial index for the processed-video listings
+--
+-- /v1/videos, /v1/videos/summary and /v1/questions all read
+-- WHERE status = 'processed' ORDER BY published_at DESC LIMIT n. With
+-- this index that is a bounded index scan instead of filtering and
+-- sorting the whole table, and pending/failed rows stay out of it.
+-- Idempotent: safe to re-run.
+--
+--   psql "$DATABASE_URL" -f migrations/006_processed_videos_published_index.sql
+
+CREATE INDEX IF NOT EXISTS idx_videos_processed_published
+    ON videos (published_at DESC)
+    WHERE status = 'processed';
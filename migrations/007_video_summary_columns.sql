@@ -0,0 +1,35 @@
+-- Migration 007: precomputed Q&A aggregates on videos
+--
+-- /v1/videos/summary used to aggregate qa_items and tags for every video
+-- on the page on every request, although they only change when a video
+-- is (re)processed or reclassified. These columns hold the aggregates;
+-- the write paths refresh them (crud.refresh_video_summaries) and the
+-- endpoint becomes a plain paged SELECT. The UPDATE backfills existing
+-- videos. Idempotent: safe to re-run.
+--
+-- Apply before deploying code that reads or writes these columns.
+--
+--   psql "$DATABASE_URL" -f migrations/007_video_summary_columns.sql
+
+ALTER TABLE videos
+    ADD COLUMN IF NOT EXISTS qa_count INTEGER,
+    ADD COLUMN IF NOT EXISTS categories TEXT[],
+    ADD COLUMN IF NOT EXISTS subcategories TEXT[],
+    ADD COLUMN IF NOT EXISTS tags TEXT[];
+
+UPDATE videos v
+SET (qa_count, categories, subcategories, tags) = (
+    SELECT
+        COUNT(*),
+        COALESCE(ARRAY_AGG(DISTINCT q.category) FILTER (WHERE q.category IS NOT NULL), '{}'),
+        COALESCE(ARRAY_AGG(DISTINCT q.subcategory) FILTER (WHERE q.subcategory IS NOT NULL), '{}'),
+        COALESCE((
+            SELECT ARRAY_AGG(DISTINCT t.name)
+            FROM qa_items q2
+            JOIN qa_item_tags qt ON qt.qa_item_id = q2.id
+            JOIN tags t ON t.id = qt.tag_id
+            WHERE q2.video_id = v.id
+        ), '{}')
+    FROM qa_items q
+    WHERE q.video_id = v.id
+);
@@ -3,47 +3,62 @@ Script to export transcripts and descriptions for videos.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from app.youtube.ids import get_video_id
 from app.youtube.metadata import get_video_metadata
-from app.youtube.transcripts import get_raw_transcript, transcript_to_full_text
+from app.youtube.transcripts import get_raw_transcript
+
+EXPORT_WORKERS = 8
 
 
 def export_video_data(youtube_url: str, output_dir: str = "exports"):
     """
     Export transcript and description for a video.
     
+    Progress lines are collected and printed together when the video is
+    done, so exports running in parallel don't interleave their output.
+    
     Args:
         youtube_url: Full YouTube URL or video ID
         output_dir: Directory to save exports
     """
+    log: list[str] = []
+    try:
+        return _export_video_data(youtube_url, output_dir, log)
+    finally:
+        print("\n" + "\n".join(log))
+
+
+def _export_video_data(youtube_url: str, output_dir: str, log: list[str]) -> bool:
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
     # Extract video ID
     video_id = get_video_id(youtube_url)
     if not video_id:
-        print(f"❌ Could not extract video ID from: {youtube_url}")
+        log.append(f"❌ Could not extract video ID from: {youtube_url}")
         return False
     
-    print(f"📹 Processing video: {video_id}")
+    log.append(f"📹 Processing video: {video_id}")
     
     # Fetch metadata
-    print("  ⬇️  Fetching metadata...")
+    log.append("  ⬇️  Fetching metadata...")
     metadata = get_video_metadata(video_id)
     if not metadata:
-        print(f"  ❌ Could not fetch metadata for {video_id}")
+        log.append(f"  ❌ Could not fetch metadata for {video_id}")
         return False
     
-    print(f"  ✅ Title: {metadata.title}")
+    log.append(f"  ✅ Title: {metadata.title}")
     
     # Fetch transcript
-    print("  ⬇️  Fetching transcript...")
+    log.append("  ⬇️  Fetching transcript...")
     transcript_segments = get_raw_transcript(video_id)
     if not transcript_segments:
-        print(f"  ❌ Could not fetch transcript for {video_id}")
+        log.append(f"  ❌ Could not fetch transcript for {video_id}")
         return False
     
-    print(f"  ✅ Transcript: {len(transcript_segments)} segments")
+    log.append(f"  ✅ Transcript: {len(transcript_segments)} segments")
     
     # Save description
     desc_filename = f"{video_id}_description.txt"
@@ -54,26 +69,30 @@ def export_video_data(youtube_url: str, output_dir: str = "exports"):
         f.write(f"Published: {metadata.published_at}\n")
         f.write(f"\n{'='*80}\n\n")
         f.write(metadata.description)
-    print(f"  💾 Saved description: {desc_path}")
+    log.append(f"  💾 Saved description: {desc_path}")
     
     # Save transcript
     transcript_filename = f"{video_id}_transcript.txt"
     transcript_path = os.path.join(output_dir, transcript_filename)
-    full_transcript = transcript_to_full_text(transcript_segments)
     
     with open(transcript_path, 'w', encoding='utf-8') as f:
         f.write(f"Video: {metadata.title}\n")
         f.write(f"URL: https://www.youtube.com/watch?v={video_id}\n")
         f.write(f"Published: {metadata.published_at}\n")
         f.write(f"\n{'='*80}\n\n")
-        # Write timestamped segments
+        # Write timestamped segments, collecting the plain text in the
+        # same pass (same output as transcript_to_full_text). The lines
+        # are joined and written once rather than one write per segment.
+        lines = []
+        texts = []
         for seg in transcript_segments:
-            minutes = int(seg.start // 60)
-            seconds = int(seg.start % 60)
-            f.write(f"[{minutes:02d}:{seconds:02d}] {seg.text}\n")
+            minutes, seconds = divmod(int(seg.start), 60)
+            lines.append(f"[{minutes:02d}:{seconds:02d}] {seg.text}\n")
+            texts.append(seg.text)
+        f.write("".join(lines))
         f.write(f"\n{'='*80}\n\nFULL TEXT (No timestamps):\n\n")
-        f.write(full_transcript)
-    print(f"  💾 Saved transcript: {transcript_path}")
+        f.write(" ".join(texts))
+    log.append(f"  💾 Saved transcript: {transcript_path}")
     
     return True
 
@@ -103,9 +122,10 @@ def main():
         "6Ih9uEGeJBI",
     ]
     
-    for video_id in videos_without_qa:
-        print()
-        export_video_data(video_id)
+    # Independent network-bound exports: run them side by side.
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+        for _ in executor.map(export_video_data, videos_without_qa):
+            pass
     
     print("\n" + "=" * 80)
     print("✅ Export complete! Check the 'exports' directory.")
@@ -6,8 +6,19 @@ video data, making it ready to send to a large language model.
 """
 
 import os
+import re
 import sys
 
+# Header lines written by export_transcripts.py
+_TITLE_RE = re.compile(r"^Video: (.*)$", re.MULTILINE)
+_URL_RE = re.compile(r"^URL: (.*)$", re.MULTILINE)
+# From the "(Questions and) Timestamps:" line to two blank lines in a row;
+# the line right after the heading is always kept, even if blank.
+_TIMESTAMPS_RE = re.compile(
+    r"^[^\n]*Timestamps:[^\n]*(?:\n[^\n]*)?.*?(?=\n[^\S\n]*\n[^\S\n]*\n|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
 
 def load_file(filepath: str) -> str:
     """Load content from a file."""
@@ -19,36 +30,23 @@ def extract_video_info(description_path: str) -> tuple[str, str, str]:
     """
     Extract title, URL, and timestamp section from a description file.
     
+    The timestamp section runs from the first line mentioning
+    "Timestamps:" up to the next pair of blank lines.
+    
     Returns:
         (title, url, timestamps_section)
     """
     content = load_file(description_path)
-    lines = content.split('\n')
-    
-    title = ""
-    url = ""
-    timestamps = []
-    in_timestamps = False
-    
-    for line in lines:
-        if line.startswith("Video: "):
-            title = line.replace("Video: ", "").strip()
-        elif line.startswith("URL: "):
-            url = line.replace("URL: ", "").strip()
-        elif "Questions and Timestamps:" in line or "Timestamps:" in line:
-            in_timestamps = True
-            timestamps.append(line)
-        elif in_timestamps:
-            # Stop at empty lines or obvious section breaks
-            if line.strip() == "" and len(timestamps) > 2:
-                # Multiple empty lines = end of timestamps
-                if timestamps and timestamps[-1].strip() == "":
-                    break
-            timestamps.append(line)
-    
-    timestamps_section = '\n'.join(timestamps).strip()
-    
-    return title, url, timestamps_section
+    
+    title = _TITLE_RE.search(content)
+    url = _URL_RE.search(content)
+    timestamps = _TIMESTAMPS_RE.search(content)
+    
+    return (
+        title.group(1).strip() if title else "",
+        url.group(1).strip() if url else "",
+        timestamps.group(0).strip() if timestamps else "",
+    )
 
 
 def prepare_prompt(